@@ -6,6 +6,7 @@ Description: Validates test results against expected outcomes
 """
 
 import re
+from array import array
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
@@ -189,27 +190,33 @@ class PerformanceValidator:
     """Validates performance metrics"""
     
     def __init__(self):
-        self.metrics_history: List[Dict[str, Any]] = []
-    
+        # Column-oriented storage: one compact C-double array of values
+        # (and one of timestamps) per metric name, so validations
+        # reduce over a contiguous column instead of filtering a list
+        # of per-sample dicts
+        self._values: Dict[str, array] = {}
+        self._timestamps: Dict[str, array] = {}
+
     def record_metric(self, metric_name: str, value: float, timestamp: float):
         """Record a performance metric"""
-        self.metrics_history.append({
-            "name": metric_name,
-            "value": value,
-            "timestamp": timestamp
-        })
-    
+        column = self._values.get(metric_name)
+        if column is None:
+            column = self._values[metric_name] = array('d')
+            self._timestamps[metric_name] = array('d')
+        column.append(value)
+        self._timestamps[metric_name].append(timestamp)
+
     def validate_latency(self, max_latency_ms: float) -> ValidationResult:
         """Validate communication latency"""
-        latency_metrics = [m for m in self.metrics_history if m["name"] == "latency"]
-        
-        if not latency_metrics:
+        latencies = self._values.get("latency")
+
+        if not latencies:
             return ValidationResult(
                 is_valid=False,
                 error_message="No latency metrics recorded"
             )
-        
-        max_recorded = max(m["value"] for m in latency_metrics)
+
+        max_recorded = max(latencies)
         
         if max_recorded > max_latency_ms:
             return ValidationResult(
@@ -221,15 +228,15 @@ class PerformanceValidator:
     
     def validate_throughput(self, min_messages_per_second: float) -> ValidationResult:
         """Validate message throughput"""
-        throughput_metrics = [m for m in self.metrics_history if m["name"] == "throughput"]
-        
-        if not throughput_metrics:
+        throughput = self._values.get("throughput")
+
+        if not throughput:
             return ValidationResult(
                 is_valid=False,
                 error_message="No throughput metrics recorded"
             )
-        
-        avg_throughput = sum(m["value"] for m in throughput_metrics) / len(throughput_metrics)
+
+        avg_throughput = sum(throughput) / len(throughput)
         
         if avg_throughput < min_messages_per_second:
             return ValidationResult(
@@ -241,7 +248,8 @@ class PerformanceValidator:
     
     def clear_metrics(self):
         """Clear recorded metrics"""
-        self.metrics_history.clear()
+        self._values.clear()
+        self._timestamps.clear()
 
 
 class ErrorPatternValidator:
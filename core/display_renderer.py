@@ -12,7 +12,7 @@ from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 
 from models.display_config import (
-    DisplayTheme, VirtualDisplayConfig, DISPLAY_THEMES
+    DisplayTheme, VirtualDisplayConfig, THEME_COLORS
 )
 
 
@@ -90,26 +90,25 @@ class DisplayRenderer:
     
     def render_display(self, config: VirtualDisplayConfig, content: List[str]) -> RenderedDisplay:
         """Render a complete display with content"""
-        # Get theme colors
-        theme_info = DISPLAY_THEMES[config.theme]
-        colors = theme_info["colors"]
-        
+        # Get theme colors — one flat lookup per frame
+        bg_color, text_color, border_color = THEME_COLORS[config.theme]
+
         # Calculate display size
         width, height = self.calculate_display_size(config)
-        
+
         # Create image
-        image = Image.new('RGB', (width, height), colors["bg"])
+        image = Image.new('RGB', (width, height), bg_color)
         draw = ImageDraw.Draw(image)
-        
+
         # Draw border
-        self._draw_border(draw, width, height, colors["border"])
-        
+        self._draw_border(draw, width, height, border_color)
+
         # Draw display content
-        self._draw_content(draw, config, content, colors, width, height)
-        
+        self._draw_content(draw, config, content, text_color, border_color, width, height)
+
         # Draw cursor if visible
         if config.cursor_visible:
-            self._draw_cursor(draw, config, colors, width, height)
+            self._draw_cursor(draw, config, text_color, width, height)
         
         # Apply visual effects
         image = self._apply_visual_effects(image, config)
@@ -121,9 +120,9 @@ class DisplayRenderer:
             theme=config.theme,
             content=content.copy(),
             timestamp=datetime.now(),
-            background_color=colors["bg"],
-            text_color=colors["text"],
-            border_color=colors["border"],
+            background_color=bg_color,
+            text_color=text_color,
+            border_color=border_color,
             font_size=config.font_size,
             cursor_visible=config.cursor_visible,
             cursor_position=(0, 0),  # Will be updated
@@ -146,8 +145,9 @@ class DisplayRenderer:
             width=1
         )
     
-    def _draw_content(self, draw: ImageDraw.Draw, config: VirtualDisplayConfig, 
-                     content: List[str], colors: Dict[str, str], width: int, height: int):
+    def _draw_content(self, draw: ImageDraw.Draw, config: VirtualDisplayConfig,
+                     content: List[str], text_color: str, border_color: str,
+                     width: int, height: int):
         """Draw text content on display"""
         font = self.get_font(config.font_size)
         
@@ -179,14 +179,14 @@ class DisplayRenderer:
             
             # Draw text with glow effect for certain themes
             if config.theme in [DisplayTheme.LED_RED, DisplayTheme.VFD_CYAN]:
-                self._draw_text_with_glow(draw, text, x, y, font, colors["text"])
+                self._draw_text_with_glow(draw, text, x, y, font, text_color)
             else:
-                draw.text((x, y), text, font=font, fill=colors["text"])
-            
+                draw.text((x, y), text, font=font, fill=text_color)
+
             # Draw character separators for LCD themes
             if config.theme in [DisplayTheme.LCD_GREEN, DisplayTheme.LCD_BLUE]:
-                self._draw_character_grid(draw, x, y, char_width, char_height, 
-                                        len(text), colors["border"])
+                self._draw_character_grid(draw, x, y, char_width, char_height,
+                                        len(text), border_color)
     
     def _draw_text_with_glow(self, draw: ImageDraw.Draw, text: str, x: int, y: int, 
                             font: ImageFont.FreeTypeFont, color: str):
@@ -218,8 +218,8 @@ class DisplayRenderer:
         draw.line([x, y + char_height, x + char_count * char_width, y + char_height], 
                  fill=grid_color, width=1)
     
-    def _draw_cursor(self, draw: ImageDraw.Draw, config: VirtualDisplayConfig, 
-                    colors: Dict[str, str], width: int, height: int):
+    def _draw_cursor(self, draw: ImageDraw.Draw, config: VirtualDisplayConfig,
+                    text_color: str, width: int, height: int):
         """Draw cursor at current position"""
         if not config.cursor_visible:
             return
@@ -245,7 +245,7 @@ class DisplayRenderer:
         # Draw cursor
         draw.rectangle(
             [cursor_x, cursor_y, cursor_x + cursor_width, cursor_y + cursor_height],
-            fill=colors["text"]
+            fill=text_color
         )
     
     def _apply_visual_effects(self, image: Image.Image, config: VirtualDisplayConfig) -> Image.Image:
@@ -37,6 +37,12 @@ from models.communication import (
     USBDeviceInfo, NetworkConnection, SERIAL_PROTOCOLS, USB_PROTOCOLS
 )
 
+# Hot-path protocol frames bound once; saves a dict lookup per outbound
+# frame in the send paths
+_CLEAR_SCREEN = SERIAL_PROTOCOLS["CLEAR_SCREEN"]
+_HID_CLEAR = USB_PROTOCOLS["HID_CLEAR"]
+_HID_WRITE = USB_PROTOCOLS["HID_WRITE"]
+
 
 class SerialPortMock:
     """Mock serial port for simulation"""
@@ -486,6 +492,11 @@ class SerialEmulator:
             self.statistics['total_messages'] += 1
             self.statistics['successful_messages'] += 1
             self._update_average_latency(comm.latency)
+            self.emit('stats-changed', {
+                'total': 1,
+                'successful': 1,
+                'latency_ms': comm.latency
+            })
             
             # Process display update
             await self._process_display_message(port_name, message, config)
@@ -500,6 +511,7 @@ class SerialEmulator:
             # Update error statistics
             self.statistics['total_messages'] += 1
             self.statistics['failed_messages'] += 1
+            self.emit('stats-changed', {'total': 1, 'failed': 1})
             
             error_comm = Communication(
                 id=str(uuid.uuid4()),
@@ -526,7 +538,7 @@ class SerialEmulator:
         """Send data via serial protocol"""
         # Add serial protocol framing if needed
         if data == b"clear":
-            data = SERIAL_PROTOCOLS["CLEAR_SCREEN"]
+            data = _CLEAR_SCREEN
         
         # Simulate transmission time
         transmission_time = len(data) / (config.baud_rate / 8)  # bytes per second
@@ -538,9 +550,9 @@ class SerialEmulator:
         """Send data via USB HID protocol"""
         # Frame data for USB HID
         if data.startswith(b"clear"):
-            hid_data = USB_PROTOCOLS["HID_CLEAR"]
+            hid_data = _HID_CLEAR
         else:
-            hid_data = USB_PROTOCOLS["HID_WRITE"] + data[:62]  # USB HID packet limit
+            hid_data = _HID_WRITE + data[:62]  # USB HID packet limit
         
         # Simulate USB transmission
         await asyncio.sleep(0.001)  # USB is fast
@@ -579,9 +591,10 @@ class SerialEmulator:
             if len(lines) > config.display_lines:
                 lines = lines[:config.display_lines]
             
-            # Pad with empty lines if needed
-            while len(lines) < config.display_lines:
-                lines.append("")
+            # Pad with empty lines if needed — one C-level list extend
+            # instead of an interpreter-loop append per line
+            if len(lines) < config.display_lines:
+                lines += [""] * (config.display_lines - len(lines))
             
             # Truncate lines to display width
             for i, line in enumerate(lines):
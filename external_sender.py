@@ -65,14 +65,15 @@ class ExternalMessageSender:
     
     async def send_multiple_messages(self, port_name: str, messages: list, delay: float = 2.0):
         """Send multiple messages with delay"""
-        print(f"📋 Sending {len(messages)} messages to {port_name} with {delay}s delay")
+        total = len(messages)
+        print(f"📋 Sending {total} messages to {port_name} with {delay}s delay")
         print()
-        
+
         for i, message in enumerate(messages, 1):
-            print(f"[{i}/{len(messages)}]", end=" ")
+            print(f"[{i}/{total}]", end=" ")
             success = await self.send_message(port_name, message)
-            
-            if success and i < len(messages):
+
+            if success and i < total:
                 print(f"⏱️  Waiting {delay}s before next message...")
                 await asyncio.sleep(delay)
             
@@ -112,11 +113,12 @@ async def main():
     print(f"✅ Found {len(active_ports)} active display(s): {', '.join(active_ports)}")
     print()
     
-    # Demo messages
+    # Demo messages (timestamp computed once so the set is deterministic)
+    now = time.strftime('%H:%M:%S')
     demo_messages = [
         "Hello from External App!",
         "Message 2",
-        f"Time: {time.strftime('%H:%M:%S')}",
+        f"Time: {now}",
         "Final message"
     ]
     
@@ -6,10 +6,17 @@ Description: Example of how a real external application would communicate with V
 using standard pyserial library (not the internal emulator API)
 """
 
+import os
 import time
 import sys
 from datetime import datetime
 
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows: no fcntl, fall back to in_waiting polling
+    FCNTL_AVAILABLE = False
+
 try:
     import serial
     import serial.tools.list_ports
@@ -19,6 +26,11 @@ except ImportError:
     print("❌ pyserial not available. Install with: pip install pyserial")
     sys.exit(1)
 
+# Control bytes stripped from responses before decoding (done in C via
+# bytes.translate, skipping the intermediate str.strip allocation)
+_STRIP_CTRL = b'\r\n'
+
+
 class ExternalSerialApp:
     """External application using standard pyserial to communicate"""
     
@@ -57,10 +69,15 @@ class ExternalSerialApp:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=timeout
+                timeout=timeout,
+                write_timeout=timeout  # bound blocking writes under backpressure
             )
             
             if ser.is_open:
+                # Non-blocking fd lets send_message read responses with a
+                # single os.read instead of an in_waiting ioctl + read pair
+                if FCNTL_AVAILABLE:
+                    fcntl.fcntl(ser.fileno(), fcntl.F_SETFL, os.O_NONBLOCK)
                 self.connections[port_name] = ser
                 print(f"✅ Connected to {port_name}")
                 return True
@@ -89,16 +106,29 @@ class ExternalSerialApp:
                 message += '\\r\\n'
             
             # Send message
-            bytes_sent = ser.write(message.encode('utf-8'))
-            ser.flush()  # Ensure data is sent immediately
+            try:
+                bytes_sent = ser.write(message.encode('utf-8'))
+                ser.flush()  # Ensure data is sent immediately
+            except serial.SerialTimeoutException:
+                print(f"⏱️  Write timeout on {port_name}, dropping message")
+                ser.reset_output_buffer()
+                return False
             
             print(f"📤 Sent {bytes_sent} bytes to {port_name}: '{message.strip()}'")
             
             # Try to read response (if any)
             time.sleep(0.1)  # Give time for response
-            if ser.in_waiting > 0:
-                response = ser.read(ser.in_waiting).decode('utf-8', errors='ignore')
-                print(f"📥 Response: '{response.strip()}'")
+            if FCNTL_AVAILABLE:
+                try:
+                    raw = os.read(ser.fileno(), 4096)
+                except BlockingIOError:
+                    raw = b""
+            else:
+                raw = ser.read(ser.in_waiting) if ser.in_waiting > 0 else b""
+            if raw:
+                # Protocol payload is ASCII: strip CR/LF in C, then decode
+                response = raw.translate(None, delete=_STRIP_CTRL).decode('ascii', 'ignore')
+                print(f"📥 Response: '{response}'")
             
             return True
             
@@ -108,23 +138,24 @@ class ExternalSerialApp:
     
     def send_multiple_messages(self, port_name: str, messages: list, delay: float = 2.0):
         """Send multiple messages with delay"""
-        print(f"📋 Sending {len(messages)} messages to {port_name}")
+        total = len(messages)
+        print(f"📋 Sending {total} messages to {port_name}")
         print()
-        
+
         success_count = 0
         for i, message in enumerate(messages, 1):
-            print(f"[{i}/{len(messages)}]", end=" ")
-            
+            print(f"[{i}/{total}]", end=" ")
+
             if self.send_message(port_name, message):
                 success_count += 1
-            
-            if i < len(messages):
+
+            if i < total:
                 print(f"⏱️  Waiting {delay}s...")
                 time.sleep(delay)
-            
+
             print()
-        
-        print(f"📊 Results: {success_count}/{len(messages)} messages sent successfully")
+
+        print(f"📊 Results: {success_count}/{total} messages sent successfully")
         return success_count
     
     def disconnect_all(self):
@@ -170,13 +201,14 @@ def main():
     
     print()
     
-    # Demo messages
+    # Demo messages (timestamp computed once so the set is deterministic)
+    now = datetime.now().strftime('%H:%M:%S')
     demo_messages = [
-        f"Hello from External App at {datetime.now().strftime('%H:%M:%S')}",
+        f"Hello from External App at {now}",
         "This is message #2",
         "Testing VirtualDisplayPy",
         "Display update test",
-        f"Final message at {datetime.now().strftime('%H:%M:%S')}"
+        f"Final message at {now}"
     ]
     
     # Send messages
@@ -0,0 +1,36 @@
+"""
+🧩 Qt Binding Shim - Single-binding imports for the GUI package
+Date: 03/09/2025
+Description: Imports the Qt binding once so GUI modules avoid the
+try/except PySide6/PyQt6 swap at every import. Mixing bindings in one
+process carries measurable dispatch overhead; the project standardizes
+on PySide6 (pinned in requirements.txt).
+"""
+
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, Slot, QThread, QObject, QSize, QRect
+)
+from PySide6.QtGui import (
+    QPixmap, QFont, QIcon, QPainter, QColor, QAction
+)
+from PySide6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QGridLayout, QPushButton, QLabel, QComboBox, QSpinBox, QCheckBox,
+    QTabWidget, QScrollArea, QFrame, QStatusBar, QMenuBar, QMenu,
+    QMessageBox, QDialog, QDialogButtonBox, QFormLayout, QLineEdit,
+    QTextEdit, QProgressBar, QSplitter, QGroupBox, QToolButton
+)
+
+__all__ = [
+    # QtCore
+    'Qt', 'QTimer', 'Signal', 'Slot', 'QThread', 'QObject', 'QSize', 'QRect',
+    # QtGui
+    'QPixmap', 'QFont', 'QIcon', 'QPainter', 'QColor', 'QAction',
+    # QtWidgets
+    'QApplication', 'QMainWindow', 'QWidget', 'QVBoxLayout', 'QHBoxLayout',
+    'QGridLayout', 'QPushButton', 'QLabel', 'QComboBox', 'QSpinBox',
+    'QCheckBox', 'QTabWidget', 'QScrollArea', 'QFrame', 'QStatusBar',
+    'QMenuBar', 'QMenu', 'QMessageBox', 'QDialog', 'QDialogButtonBox',
+    'QFormLayout', 'QLineEdit', 'QTextEdit', 'QProgressBar', 'QSplitter',
+    'QGroupBox', 'QToolButton',
+]
@@ -6,21 +6,19 @@ Description: Configuration panel for virtual display settings
 
 from typing import Optional
 
-try:
-    from PySide6.QtWidgets import (
-        QWidget, QVBoxLayout, QFormLayout, QComboBox, QSpinBox,
-        QCheckBox, QGroupBox, QSlider, QLabel, QLineEdit
-    )
-    from PySide6.QtCore import Qt, Signal
-except ImportError:
-    from PyQt6.QtWidgets import (
-        QWidget, QVBoxLayout, QFormLayout, QComboBox, QSpinBox,
-        QCheckBox, QGroupBox, QSlider, QLabel, QLineEdit
-    )
-    from PyQt6.QtCore import Qt, pyqtSignal as Signal
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QFormLayout, QComboBox, QSpinBox,
+    QCheckBox, QGroupBox, QSlider, QLabel, QLineEdit
+)
+from PySide6.QtCore import Qt, Signal
 
 from models.display_config import VirtualDisplay, VirtualDisplayConfig, DisplayTheme, ConnectionType, BAUD_RATES
 
+# Combo box items computed once at module load instead of per-panel
+_BAUD_RATE_STRS = tuple(str(rate) for rate in BAUD_RATES)
+_CONN_NAMES = ("Série", "USB", "Réseau")
+_THEME_NAMES = ("LCD Vert", "LCD Bleu", "LED Rouge", "OLED Blanc", "VFD Cyan")
+
 
 class ConfigurationPanel(QWidget):
     """Configuration panel for display settings"""
@@ -57,11 +55,11 @@ class ConfigurationPanel(QWidget):
         basic_layout.addRow("Port:", self.port_name_edit)
         
         self.connection_type_combo = QComboBox()
-        self.connection_type_combo.addItems(["Série", "USB", "Réseau"])
+        self.connection_type_combo.addItems(_CONN_NAMES)
         basic_layout.addRow("Type:", self.connection_type_combo)
         
         self.baud_rate_combo = QComboBox()
-        self.baud_rate_combo.addItems([str(rate) for rate in BAUD_RATES])
+        self.baud_rate_combo.addItems(_BAUD_RATE_STRS)
         basic_layout.addRow("Débit:", self.baud_rate_combo)
         
         config_layout.addWidget(basic_group)
@@ -79,9 +77,7 @@ class ConfigurationPanel(QWidget):
         display_layout.addRow("Longueur:", self.length_spin)
         
         self.theme_combo = QComboBox()
-        self.theme_combo.addItems([
-            "LCD Vert", "LCD Bleu", "LED Rouge", "OLED Blanc", "VFD Cyan"
-        ])
+        self.theme_combo.addItems(_THEME_NAMES)
         display_layout.addRow("Thème:", self.theme_combo)
         
         config_layout.addWidget(display_group)
@@ -142,14 +138,19 @@ class ConfigurationPanel(QWidget):
     def set_display(self, display: Optional[VirtualDisplay]):
         """Set the display to configure"""
         self.current_display = display
-        
-        if display is None:
-            self.no_display_label.setVisible(True)
-            self.config_widget.setVisible(False)
-        else:
-            self.no_display_label.setVisible(False)
-            self.config_widget.setVisible(True)
-            self.load_configuration(display.config)
+
+        # Toggle both widgets under a single repaint to avoid two relayouts
+        self.setUpdatesEnabled(False)
+        try:
+            if display is None:
+                self.no_display_label.setVisible(True)
+                self.config_widget.setVisible(False)
+            else:
+                self.no_display_label.setVisible(False)
+                self.config_widget.setVisible(True)
+                self.load_configuration(display.config)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def load_configuration(self, config: VirtualDisplayConfig):
         """Load configuration into UI"""
@@ -4,67 +4,156 @@ Date: 03/09/2025
 Description: Qt widget representing a single virtual display
 """
 
+import asyncio
+import functools
+import time
 from typing import Optional
-from datetime import datetime
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QFrame, QMenu, QMessageBox
+)
+from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtGui import QPixmap, QPainter, QFont, QColor, QContextMenuEvent
 
 try:
-    from PySide6.QtWidgets import (
-        QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-        QFrame, QMenu, QMessageBox
-    )
-    from PySide6.QtCore import Qt, Signal, QTimer
-    from PySide6.QtGui import QPixmap, QPainter, QFont, QColor, QContextMenuEvent
+    from qasync import asyncSlot
 except ImportError:
-    from PyQt6.QtWidgets import (
-        QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
-        QFrame, QMenu, QMessageBox
-    )
-    from PyQt6.QtCore import Qt, pyqtSignal as Signal, QTimer
-    from PyQt6.QtGui import QPixmap, QPainter, QFont, QColor
-
-from models.display_config import VirtualDisplay, ConnectionType, DISPLAY_THEMES
+    # Fallback without qasync: schedule the coroutine on the running
+    # asyncio loop (requires a Qt-integrated loop to actually execute)
+    def asyncSlot(*slot_args):
+        def decorator(coro_fn):
+            @functools.wraps(coro_fn)
+            def wrapper(*args, **kwargs):
+                asyncio.ensure_future(coro_fn(*args, **kwargs))
+            return wrapper
+        return decorator
+
+from models.display_config import VirtualDisplay, ConnectionType, THEME_COLORS
 from core.serial_emulator import SerialEmulator
 from core.display_renderer import DisplayRenderer
 
 
+# Application-level stylesheet: parsed once by Qt for every display widget,
+# with selection driven by a dynamic property instead of per-widget
+# setStyleSheet swaps (applied via QApplication.setStyleSheet in main.py)
+APPLICATION_QSS = """
+VirtualDisplayWidget {
+    border: 2px solid #ddd;
+    border-radius: 8px;
+    background-color: white;
+}
+VirtualDisplayWidget:hover {
+    border-color: #aaa;
+}
+VirtualDisplayWidget[selected="true"] {
+    border: 2px solid #0078d4;
+    background-color: #f0f8ff;
+}
+VirtualDisplayWidget QLabel#screen {
+    border: 1px solid #333;
+    border-radius: 4px;
+}
+"""
+
+# Theme colors resolved once at import time (bg, text) per theme
+_SCREEN_COLORS = {
+    theme: (bg, text) for theme, (bg, text, _border) in THEME_COLORS.items()
+}
+_DEFAULT_SCREEN_COLORS = ("#001100", "#00ff00")
+
+
 class VirtualDisplayWidget(QFrame):
     """Widget representing a single virtual display"""
     
     # Signals
     selected = Signal(str)  # display_id
     remove_requested = Signal(str)  # display_id
-    
-    def __init__(self, display: VirtualDisplay, serial_emulator: SerialEmulator, 
+    content_changed = Signal(list)  # new display content
+    active_changed = Signal(bool)  # connection state
+
+    # Interned status glyphs shared by all instances
+    _CONN_ICONS = {
+        ConnectionType.SERIAL: "📟",
+        ConnectionType.USB: "🔌",
+    }
+    _DEFAULT_CONN_ICON = "🌐"
+    _STATUS_ICONS = {True: "🟢", False: "🔴"}
+    _CONNECT_LABELS = {True: "Déconnecter", False: "Connecter"}
+
+    # Screen fonts shared across all widgets, keyed by pixel size
+    _SCREEN_FONT_CACHE: dict = {}
+
+    # One flush timer serves every widget's throttled refreshes, so M
+    # widgets cost one event-loop wakeup per frame instead of M
+    _flush_timer: Optional[QTimer] = None
+    _pending_widgets: set = set()
+
+    @classmethod
+    def _shared_flush_timer(cls) -> QTimer:
+        """Return the class-wide single-shot flush timer, creating it lazily"""
+        if cls._flush_timer is None:
+            cls._flush_timer = QTimer()
+            cls._flush_timer.setSingleShot(True)
+            cls._flush_timer.setInterval(33)
+            cls._flush_timer.timeout.connect(cls._flush_pending)
+        return cls._flush_timer
+
+    @classmethod
+    def _flush_pending(cls):
+        """Apply refreshes deferred during the last throttle window"""
+        pending = list(cls._pending_widgets)
+        cls._pending_widgets.clear()
+        for widget in pending:
+            widget._update_display_now()
+        if pending:
+            cls._flush_timer.start()
+
+    @classmethod
+    def _font(cls, size: int) -> QFont:
+        """Return the shared monospace screen font for a pixel size"""
+        font = cls._SCREEN_FONT_CACHE.get(size)
+        if font is None:
+            font = QFont("monospace")
+            font.setPixelSize(size)
+            cls._SCREEN_FONT_CACHE[size] = font
+        return font
+
+    def __init__(self, display: VirtualDisplay, serial_emulator: SerialEmulator,
                  display_renderer: DisplayRenderer):
         super().__init__()
-        
+
         self.display = display
         self.serial_emulator = serial_emulator
         self.display_renderer = display_renderer
         self.is_selected = False
-        
+        self._needs_refresh = False
+        self._screen_pix = None
+        self._last_active = None
+        self._last_content = None
+        self._last_render_style = None
+        self._shared_box = None
+        self._menu = None
+        self._blank_content = [""] * display.config.display_lines
+
         self.setup_ui()
-        self.update_display()
-        
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(250)  # Update every 250ms
+
+        # Event-driven updates: repaint only when the emulator reports a
+        # change instead of polling on a periodic timer
+        self.content_changed.connect(self._on_content_changed)
+        self.active_changed.connect(self._on_active_changed)
+        self.serial_emulator.on('display-update', self._on_emulator_display_update)
+        self.serial_emulator.on('port-opened', self._on_emulator_port_opened)
+        self.serial_emulator.on('port-closed', self._on_emulator_port_closed)
+
+        # Initial paint once the event loop is running
+        QTimer.singleShot(0, self.update_display)
     
     def setup_ui(self):
         """Setup widget UI"""
         self.setFrameStyle(QFrame.Box)
         self.setFixedSize(300, 200)
-        self.setStyleSheet("""
-            VirtualDisplayWidget {
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                background-color: white;
-            }
-            VirtualDisplayWidget:hover {
-                border-color: #aaa;
-            }
-        """)
+        self.setProperty("selected", False)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
@@ -80,14 +169,7 @@ class VirtualDisplayWidget(QFrame):
         
         # Connection type indicator
         conn_type = self.display.config.connection_type
-        if conn_type == ConnectionType.SERIAL:
-            type_icon = "📟"
-        elif conn_type == ConnectionType.USB:
-            type_icon = "🔌"
-        else:
-            type_icon = "🌐"
-        
-        self.type_label = QLabel(type_icon)
+        self.type_label = QLabel(self._CONN_ICONS.get(conn_type, self._DEFAULT_CONN_ICON))
         header_layout.addWidget(self.type_label)
         
         # Status indicator
@@ -98,19 +180,9 @@ class VirtualDisplayWidget(QFrame):
         
         # Display screen
         self.screen_label = QLabel()
+        self.screen_label.setObjectName("screen")
         self.screen_label.setMinimumHeight(120)
         self.screen_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.screen_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #333;
-                border-radius: 4px;
-                background-color: #001100;
-                color: #00ff00;
-                font-family: monospace;
-                font-size: 12px;
-                padding: 8px;
-            }
-        """)
         layout.addWidget(self.screen_label)
         
         # Control buttons
@@ -130,110 +202,202 @@ class VirtualDisplayWidget(QFrame):
         
         layout.addLayout(buttons_layout)
     
+    def _on_emulator_display_update(self, data: dict):
+        """Emulator callback: forward content changes for this port as a signal"""
+        if data.get('port_name') == self.display.config.port_name:
+            self.content_changed.emit(data.get('content', []))
+
+    def _on_emulator_port_opened(self, data: dict):
+        """Emulator callback: forward connection for this port as a signal"""
+        if data.get('port_name') == self.display.config.port_name:
+            self.active_changed.emit(True)
+
+    def _on_emulator_port_closed(self, data: dict):
+        """Emulator callback: forward disconnection for this port as a signal"""
+        if data.get('port_name') == self.display.config.port_name:
+            self.active_changed.emit(False)
+
+    def cleanup(self):
+        """Unregister emulator handlers before the widget is destroyed"""
+        self._pending_widgets.discard(self)
+        self.serial_emulator.off('display-update', self._on_emulator_display_update)
+        self.serial_emulator.off('port-opened', self._on_emulator_port_opened)
+        self.serial_emulator.off('port-closed', self._on_emulator_port_closed)
+
+    def _on_content_changed(self, content: list):
+        """Store the latest content and request a throttled refresh"""
+        self.display.current_content = content
+        self.update_display()
+
+    def _on_active_changed(self, active: bool):
+        """Store the latest connection state and request a throttled refresh"""
+        self.display.is_active = active
+        self.update_display()
+
     def update_display(self):
+        """Request a display refresh, throttled to the display rate
+
+        Coalesced onto the shared class timer: the first request in a
+        frame paints immediately, later ones are merged into one flush.
+        """
+        timer = self._shared_flush_timer()
+        if timer.isActive():
+            self._pending_widgets.add(self)
+            return
+        self._update_display_now()
+        timer.start()
+
+    def _update_display_now(self):
         """Update display appearance"""
-        # Update connection status
-        if self.display.is_active:
-            self.status_indicator.setText("🟢")
-            self.connect_btn.setText("Déconnecter")
-        else:
-            self.status_indicator.setText("🔴")
-            self.connect_btn.setText("Connecter")
-        
-        # Update display content
-        content = self.display.current_content
+        # Hidden or scrolled-out widgets skip all work; showEvent or the
+        # scroll handler repaints them when they come back into view
+        if self._is_offscreen():
+            self._needs_refresh = True
+            return
+
+        # Batch sub-widget mutations into a single compositing pass
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_status(self.display.is_active)
+            self._update_content(self.display.current_content)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _is_offscreen(self) -> bool:
+        """True when the widget is hidden or fully scrolled out of view"""
+        return not self.isVisible() or self.visibleRegion().isEmpty()
+
+    def is_stale(self) -> bool:
+        """True when a repaint was skipped and the widget is back on-screen"""
+        return self._needs_refresh and not self._is_offscreen()
+
+    def refresh_if_stale(self):
+        """Repaint if updates were skipped while the widget was off-screen"""
+        if self.is_stale():
+            self._needs_refresh = False
+            self.update_display()
+
+    def showEvent(self, event):
+        """Refresh once when the widget becomes visible again"""
+        super().showEvent(event)
+        if self._needs_refresh:
+            self._needs_refresh = False
+            self.update_display()
+
+    def _update_status(self, active: bool):
+        """Update connection status indicators when the state transitions"""
+        if self._is_offscreen():
+            self._needs_refresh = True
+            return
+        if active == self._last_active:
+            return
+        self._last_active = active
+        self.status_indicator.setText(self._STATUS_ICONS[active])
+        self.connect_btn.setText(self._CONNECT_LABELS[active])
+
+    def _update_content(self, content: list):
+        """Update display content and theme colors"""
+        if self._is_offscreen():
+            self._needs_refresh = True
+            return
+
+        # Re-render only on real changes: list equality is a cheap C-level
+        # compare, so the strip scan and join run once per content change
+        config = self.display.config
+        style_key = (config.theme, config.font_size)
+        if content == self._last_content and style_key == self._last_render_style:
+            return
+        self._last_content = list(content)
+        self._last_render_style = style_key
+
         if content and any(line.strip() for line in content):
-            display_text = "\n".join(content[:self.display.config.display_lines])
+            display_text = "\n".join(content[:config.display_lines])
         else:
-            display_text = "Afficheur Virtuel\n" + self.display.config.port_name
-        
-        self.screen_label.setText(display_text)
-        
-        # Update theme colors
-        theme_info = DISPLAY_THEMES.get(self.display.config.theme)
-        if theme_info:
-            colors = theme_info["colors"]
-            self.screen_label.setStyleSheet(f"""
-                QLabel {{
-                    border: 1px solid #333;
-                    border-radius: 4px;
-                    background-color: {colors["bg"]};
-                    color: {colors["text"]};
-                    font-family: monospace;
-                    font-size: {self.display.config.font_size}px;
-                    padding: 8px;
-                }}
-            """)
+            display_text = "Afficheur Virtuel\n" + config.port_name
+
+        self._render_screen(display_text)
+
+    def _render_screen(self, text: str):
+        """Paint the screen text into the cached pixmap
+
+        Painting into a reused QPixmap avoids the relayout and font-metric
+        recalculation QLabel performs on every setText/setStyleSheet pair.
+        """
+        config = self.display.config
+        bg, fg = _SCREEN_COLORS.get(config.theme, _DEFAULT_SCREEN_COLORS)
+
+        size = self.screen_label.size()
+        if self._screen_pix is None or self._screen_pix.size() != size:
+            self._screen_pix = QPixmap(size)
+
+        pix = self._screen_pix
+        pix.fill(QColor(bg))
+        painter = QPainter(pix)
+        painter.setPen(QColor(fg))
+        painter.setFont(self._font(config.font_size))
+        painter.drawText(pix.rect().adjusted(8, 8, -8, -8),
+                         Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        self.screen_label.setPixmap(pix)
     
     def set_selected(self, selected: bool):
-        """Set selection state"""
+        """Set selection state via the dynamic property styled by APPLICATION_QSS"""
+        if selected == self.is_selected:
+            return
         self.is_selected = selected
-        if selected:
-            self.setStyleSheet("""
-                VirtualDisplayWidget {
-                    border: 2px solid #0078d4;
-                    border-radius: 8px;
-                    background-color: #f0f8ff;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                VirtualDisplayWidget {
-                    border: 2px solid #ddd;
-                    border-radius: 8px;
-                    background-color: white;
-                }
-                VirtualDisplayWidget:hover {
-                    border-color: #aaa;
-                }
-            """)
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
     
-    def toggle_connection(self):
+    @asyncSlot()
+    async def toggle_connection(self):
         """Toggle display connection"""
-        import asyncio
-        
         if self.display.is_active:
-            # Disconnect
-            asyncio.create_task(
-                self.serial_emulator.close_port(self.display.config.port_name)
-            )
+            await self.serial_emulator.close_port(self.display.config.port_name)
         else:
-            # Connect
-            asyncio.create_task(
-                self.serial_emulator.open_port(
-                    self.display.config.port_name, self.display.config
-                )
+            await self.serial_emulator.open_port(
+                self.display.config.port_name, self.display.config
             )
-    
-    def send_test_message(self):
+
+    def _message_box(self) -> QMessageBox:
+        """Lazily build the dialog reused for warnings and confirmations"""
+        if self._shared_box is None:
+            self._shared_box = QMessageBox(self)
+        return self._shared_box
+
+    @asyncSlot()
+    async def send_test_message(self):
         """Send test message to display"""
         if not self.display.is_active:
-            QMessageBox.warning(self, "Test", "Afficheur non connecté")
+            box = self._message_box()
+            box.setIcon(QMessageBox.Warning)
+            box.setWindowTitle("Test")
+            box.setText("Afficheur non connecté")
+            box.setStandardButtons(QMessageBox.Ok)
+            box.exec()
             return
-        
-        import asyncio
-        
-        test_message = f"Test {datetime.now().strftime('%H:%M:%S')}"
-        asyncio.create_task(
-            self.serial_emulator.send_message(
-                self.display.config.port_name, test_message, self.display.config
-            )
+
+        # time.strftime formats in C without allocating a datetime object
+        test_message = f"Test {time.strftime('%H:%M:%S')}"
+        await self.serial_emulator.send_message(
+            self.display.config.port_name, test_message, self.display.config
         )
-    
-    def clear_display(self):
+
+    @asyncSlot()
+    async def clear_display(self):
         """Clear display content"""
         if not self.display.is_active:
             return
-        
-        import asyncio
-        
-        asyncio.create_task(
-            self.serial_emulator.send_message(
-                self.display.config.port_name, "", self.display.config
-            )
+
+        await self.serial_emulator.send_message(
+            self.display.config.port_name, "", self.display.config
         )
-        
-        self.display.current_content = [""] * self.display.config.display_lines
+
+        # Reuse the preallocated clear buffer, rebuilt only if the line
+        # count was reconfigured since construction
+        if len(self._blank_content) != self.display.config.display_lines:
+            self._blank_content = [""] * self.display.config.display_lines
+        self.display.current_content = self._blank_content[:]
     
     def mousePressEvent(self, event):
         """Handle mouse press for selection"""
@@ -241,41 +405,46 @@ class VirtualDisplayWidget(QFrame):
             self.selected.emit(self.display.id)
         super().mousePressEvent(event)
     
-    def contextMenuEvent(self, event: QContextMenuEvent):
-        """Handle right-click context menu"""
-        menu = QMenu(self)
-        
+    def _build_context_menu(self):
+        """Build the context menu once; later right-clicks reuse it"""
+        self._menu = QMenu(self)
+
         # Configuration action
-        config_action = menu.addAction("⚙️ Configuration")
+        config_action = self._menu.addAction("⚙️ Configuration")
         config_action.triggered.connect(lambda: self.selected.emit(self.display.id))
-        
-        menu.addSeparator()
-        
+
+        self._menu.addSeparator()
+
         # Test actions
-        test_action = menu.addAction("🧪 Test Message")
-        test_action.triggered.connect(self.send_test_message)
-        test_action.setEnabled(self.display.is_active)
-        
-        clear_action = menu.addAction("🗑️ Effacer")
-        clear_action.triggered.connect(self.clear_display)
-        clear_action.setEnabled(self.display.is_active)
-        
-        menu.addSeparator()
-        
+        self._test_action = self._menu.addAction("🧪 Test Message")
+        self._test_action.triggered.connect(self.send_test_message)
+
+        self._clear_action = self._menu.addAction("🗑️ Effacer")
+        self._clear_action.triggered.connect(self.clear_display)
+
+        self._menu.addSeparator()
+
         # Remove action
-        remove_action = menu.addAction("❌ Supprimer")
+        remove_action = self._menu.addAction("❌ Supprimer")
         remove_action.triggered.connect(self.confirm_remove)
-        
-        menu.exec_(event.globalPos())
+
+    def contextMenuEvent(self, event: QContextMenuEvent):
+        """Handle right-click context menu"""
+        if self._menu is None:
+            self._build_context_menu()
+
+        self._test_action.setEnabled(self.display.is_active)
+        self._clear_action.setEnabled(self.display.is_active)
+        self._menu.exec_(event.globalPos())
     
     def confirm_remove(self):
         """Confirm display removal"""
-        reply = QMessageBox.question(
-            self, "Supprimer Afficheur",
-            f"Voulez-vous vraiment supprimer l'afficheur {self.display.config.port_name} ?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
+        box = self._message_box()
+        box.setIcon(QMessageBox.Question)
+        box.setWindowTitle("Supprimer Afficheur")
+        box.setText(f"Voulez-vous vraiment supprimer l'afficheur {self.display.config.port_name} ?")
+        box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        box.setDefaultButton(QMessageBox.No)
+
+        if box.exec() == QMessageBox.Yes:
             self.remove_requested.emit(self.display.id)
\ No newline at end of file
@@ -5,31 +5,20 @@ Description: Main application window with display grid and controls
 """
 
 import sys
+import time
 import asyncio
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from dataclasses import asdict
-
-try:
-    from PySide6.QtWidgets import (
-        QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-        QPushButton, QLabel, QComboBox, QSpinBox, QCheckBox, QTabWidget,
-        QScrollArea, QFrame, QStatusBar, QMenuBar, QMenu,
-        QMessageBox, QDialog, QDialogButtonBox, QFormLayout, QLineEdit,
-        QTextEdit, QProgressBar, QSplitter, QGroupBox
-    )
-    from PySide6.QtCore import Qt, QTimer, Signal, QThread, pyqtSignal
-    from PySide6.QtGui import QPixmap, QFont, QIcon, QPainter, QColor, QAction
-except ImportError:
-    from PyQt6.QtWidgets import (
-        QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-        QPushButton, QLabel, QComboBox, QSpinBox, QCheckBox, QTabWidget,
-        QScrollArea, QFrame, QStatusBar, QMenuBar, QMenu,
-        QMessageBox, QDialog, QDialogButtonBox, QFormLayout, QLineEdit,
-        QTextEdit, QProgressBar, QSplitter, QGroupBox
-    )
-    from PyQt6.QtCore import Qt, QTimer, pyqtSignal as Signal
-    from PyQt6.QtGui import QPixmap, QFont, QIcon, QPainter, QColor, QAction
+
+from gui._qt import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QPushButton, QLabel, QComboBox, QSpinBox, QCheckBox, QTabWidget,
+    QScrollArea, QFrame, QStatusBar, QMenuBar, QMenu,
+    QMessageBox, QDialog, QDialogButtonBox, QFormLayout, QLineEdit,
+    QTextEdit, QProgressBar, QSplitter, QGroupBox, QToolButton,
+    Qt, QTimer, Signal, Slot, QThread,
+    QPixmap, QFont, QIcon, QPainter, QColor, QAction, QSize
+)
 
 from core.serial_emulator import SerialEmulator
 from core.display_renderer import DisplayRenderer
@@ -42,13 +31,128 @@ from gui.config_panel import ConfigurationPanel
 from gui.monitoring_widget import MonitoringWidget
 
 
+# Static UI text/styles built once at import time so window construction
+# and repeated dialogs never re-tokenize them
+_EMPTY_STATE_QSS = """
+    QLabel {
+        color: #666;
+        font-size: 16px;
+        padding: 40px;
+        border: 2px dashed #ccc;
+        border-radius: 8px;
+        background-color: #f9f9f9;
+    }
+"""
+
+# Control-button icons resolved from the icon theme once per name; the
+# emoji label is kept only when the theme has no match, so repaints skip
+# color-emoji glyph shaping on platforms with a proper icon theme
+_ICON_CACHE: Dict[str, QIcon] = {}
+
+
+def _themed_icon(name: str) -> QIcon:
+    """Return a cached theme icon (possibly null) for the given name"""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = QIcon.fromTheme(name)
+        _ICON_CACHE[name] = icon
+    return icon
+
+
+# Commands exposed both in the menus and as grid control buttons; each
+# shares one QAction so there is a single connection/invocation path.
+# Entries are (slot name, theme icon name, emoji fallback)
+_BUTTON_ACTIONS = (
+    ("add_serial_display", "list-add", "➕"),
+    ("add_usb_display", "drive-removable-media", "🔌"),
+    ("connect_all_displays", "network-transmit-receive", "🟢"),
+    ("disconnect_all_displays", "network-offline", "🔴"),
+    ("run_global_test", "system-run", "🧪"),
+)
+
+
+# Per-connection-type display prototypes: (port prefix, id prefix,
+# config overrides applied on top of the VirtualDisplayConfig defaults)
+_DISPLAY_PROTOS = {
+    ConnectionType.SERIAL: ("COM", "display", {}),
+    ConnectionType.USB: ("USB", "usb_display", dict(
+        usb_vendor_id="04D8",
+        usb_product_id="000A",
+        theme=DisplayTheme.LCD_BLUE,
+    )),
+}
+
+# Menu tree: (menu title, [(action label, slot name) | None for a
+# separator]). setup_menus builds all actions from this in one loop
+_MENU_SPEC = (
+    ("&Fichier", (
+        ("&Sauvegarder Configuration", "save_configuration"),
+        ("&Charger Configuration", "load_configuration"),
+        None,
+        ("&Exporter Logs", "export_logs"),
+        None,
+        ("&Quitter", "close"),
+    )),
+    ("&Afficheurs", (
+        ("Ajouter &Série", "add_serial_display"),
+        ("Ajouter &USB", "add_usb_display"),
+        None,
+        ("&Connecter Tout", "connect_all_displays"),
+        ("&Déconnecter Tout", "disconnect_all_displays"),
+    )),
+    ("&Outils", (
+        ("&Test Global", "run_global_test"),
+        None,
+        ("&Vider Logs", "clear_logs"),
+    )),
+    ("&Aide", (
+        ("À &Propos", "show_about"),
+    )),
+)
+
+# Test scenarios: (combo label, runner method name). Dispatch goes by
+# combo index so selection never does French-string comparisons
+_SCENARIOS = (
+    ("Fonctionnement Normal", "_run_normal_scenario"),
+    ("Test USB", "_run_usb_scenario"),
+    ("Simulation Paiement", "_run_payment_scenario"),
+    ("Test de Stress", "_run_stress_scenario"),
+    ("Simulation Pannes", "_run_failure_scenario"),
+)
+
+_ABOUT_TEXT = """
+VirtualDisplayPy v1.0.0
+
+Émulateur d'Afficheur Virtuel pour MostaGare
+Développé avec Python et Qt
+
+Fonctionnalités:
+• Émulation afficheurs série et USB
+• Interface graphique intuitive
+• Monitoring temps réel
+• Tests automatisés
+• Support multi-thèmes
+
+© 2025 MostaGare Development Team
+"""
+
+
 class VirtualDisplayMainWindow(QMainWindow):
     """Main application window"""
     
     # Signals
     display_added = Signal(str)  # display_id
     display_removed = Signal(str)  # display_id
-    display_updated = Signal(str, dict)  # display_id, config
+    display_updated = Signal(str, object)  # display_id, config
+
+    # Bridge signals for emulator callbacks: the emulator may fire from
+    # its I/O coroutine, so events are re-emitted as Qt signals whose
+    # (auto-queued) connections deliver the handlers on the GUI thread
+    _port_opened_sig = Signal(dict)
+    _port_closed_sig = Signal(dict)
+    _message_sent_sig = Signal(dict)
+    _message_failed_sig = Signal(dict)
+    _display_update_sig = Signal(dict)
     
     def __init__(self, serial_emulator: SerialEmulator, display_renderer: DisplayRenderer):
         super().__init__()
@@ -57,20 +161,61 @@ class VirtualDisplayMainWindow(QMainWindow):
         self.display_renderer = display_renderer
         self.displays: Dict[str, VirtualDisplay] = {}
         self.display_widgets: Dict[str, VirtualDisplayWidget] = {}
+
+        # port_name -> display index so per-event emulator callbacks
+        # resolve their target in O(1) instead of scanning every display
+        self._by_port: Dict[str, VirtualDisplay] = {}
         
         self.selected_display_id: Optional[str] = None
-        
-        # Setup UI
-        self.setup_ui()
+
+        # Coroutines scheduled from slots; references are kept so the
+        # tasks are not garbage-collected mid-flight
+        self._pending_tasks: set = set()
+
+        # Set once closeEvent has drained the port-close tasks, so the
+        # re-triggered close() falls straight through to accept
+        self._close_drained = False
+
+        # Running per-type counters for port-name generation (O(1)
+        # instead of rescanning self.displays on every add)
+        self._counters: Dict[ConnectionType, int] = {}
+
+        # Next free slot in the 3-column display grid; avoids re-probing
+        # the widget dict length and lets removal compact the grid
+        self._grid_next = 0
+
+        # Active-connection count maintained by port events so the status
+        # bar never rescans self.displays
+        self._active_count = 0
+        self._last_status: Optional[tuple] = None
+
+        # One reusable information dialog instead of a fresh QMessageBox
+        # (layout + style application) per notification
+        self._info_box = QMessageBox(self)
+        self._info_box.setIcon(QMessageBox.Icon.Information)
+        self._info_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        self._about_box: Optional[QMessageBox] = None
+
+        # Test-log buffer lives on the window because the Tests tab (and
+        # its QTextEdit) is only built when first shown
+        self._log_buffer: List[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_test_log)
+        
+        # Setup UI (menus first: the shared QActions they create are
+        # reused by the control buttons built in setup_ui)
         self.setup_menus()
+        self.setup_ui()
         self.setup_status_bar()
         self.setup_connections()
         
-        # Setup timers
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_displays)
-        self.update_timer.start(100)  # Update every 100ms
-        
+        # Status bar refreshes are event-driven and coalesced into a single
+        # queued update instead of a 100ms poll; display widgets subscribe
+        # to emulator events themselves
+        self._status_refresh_queued = False
+
         # Setup serial emulator events
         self.setup_emulator_events()
     
@@ -110,26 +255,21 @@ class VirtualDisplayMainWindow(QMainWindow):
         # Control buttons
         controls_layout = QHBoxLayout()
         
-        self.add_serial_btn = QPushButton("➕ Ajouter Série")
-        self.add_serial_btn.clicked.connect(self.add_serial_display)
+        self.add_serial_btn = self._action_button("add_serial_display")
         controls_layout.addWidget(self.add_serial_btn)
-        
-        self.add_usb_btn = QPushButton("🔌 Ajouter USB")
-        self.add_usb_btn.clicked.connect(self.add_usb_display)
+
+        self.add_usb_btn = self._action_button("add_usb_display")
         controls_layout.addWidget(self.add_usb_btn)
-        
-        self.connect_all_btn = QPushButton("🟢 Connecter Tout")
-        self.connect_all_btn.clicked.connect(self.connect_all_displays)
+
+        self.connect_all_btn = self._action_button("connect_all_displays")
         controls_layout.addWidget(self.connect_all_btn)
-        
-        self.disconnect_all_btn = QPushButton("🔴 Déconnecter Tout")
-        self.disconnect_all_btn.clicked.connect(self.disconnect_all_displays)
+
+        self.disconnect_all_btn = self._action_button("disconnect_all_displays")
         controls_layout.addWidget(self.disconnect_all_btn)
-        
+
         controls_layout.addStretch()
-        
-        self.test_btn = QPushButton("🧪 Test Global")
-        self.test_btn.clicked.connect(self.run_global_test)
+
+        self.test_btn = self._action_button("run_global_test")
         controls_layout.addWidget(self.test_btn)
         
         layout.addLayout(controls_layout)
@@ -139,27 +279,24 @@ class VirtualDisplayMainWindow(QMainWindow):
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        
+
         self.display_grid_widget = QWidget()
         self.display_grid_layout = QGridLayout(self.display_grid_widget)
         self.display_grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-        
+
         scroll_area.setWidget(self.display_grid_widget)
         layout.addWidget(scroll_area)
+        self.display_scroll_area = scroll_area
+
+        # Widgets scrolled out of the viewport skip their repaints; catch
+        # them up when scrolling brings them back into view
+        scroll_area.verticalScrollBar().valueChanged.connect(self._refresh_visible_widgets)
+        scroll_area.horizontalScrollBar().valueChanged.connect(self._refresh_visible_widgets)
         
         # Empty state
         self.empty_state_label = QLabel("Aucun afficheur configuré\n\nCliquez sur '➕ Ajouter Série' ou '🔌 Ajouter USB' pour commencer")
         self.empty_state_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_state_label.setStyleSheet("""
-            QLabel {
-                color: #666;
-                font-size: 16px;
-                padding: 40px;
-                border: 2px dashed #ccc;
-                border-radius: 8px;
-                background-color: #f9f9f9;
-            }
-        """)
+        self.empty_state_label.setStyleSheet(_EMPTY_STATE_QSS)
         layout.addWidget(self.empty_state_label)
         
         self.update_empty_state()
@@ -175,20 +312,39 @@ class VirtualDisplayMainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Configuration tab
+        # Configuration tab (default tab, built eagerly)
         self.config_panel = ConfigurationPanel()
         self.config_panel.config_changed.connect(self.on_display_config_changed)
         self.tab_widget.addTab(self.config_panel, "⚙️ Configuration")
-        
-        # Monitoring tab
-        self.monitoring_widget = MonitoringWidget(self.serial_emulator)
-        self.tab_widget.addTab(self.monitoring_widget, "📊 Monitoring")
-        
-        # Test scenarios tab
-        self.test_panel = self.create_test_panel()
-        self.tab_widget.addTab(self.test_panel, "🧪 Tests")
-        
+
+        # Monitoring and Tests tabs are placeholders until first shown:
+        # neither their widget trees nor their emulator wiring are needed
+        # on cold start
+        self.monitoring_widget: Optional[MonitoringWidget] = None
+        self.test_panel: Optional[QWidget] = None
+        self.tab_widget.addTab(QWidget(), "📊 Monitoring")
+        self.tab_widget.addTab(QWidget(), "🧪 Tests")
+        self.tab_widget.currentChanged.connect(self._maybe_build_tab)
+
         return panel
+
+    @Slot(int)
+    def _maybe_build_tab(self, index: int):
+        """Build the Monitoring or Tests tab the first time it is shown"""
+        if index == 1 and self.monitoring_widget is None:
+            self.monitoring_widget = MonitoringWidget(self.serial_emulator)
+            self._replace_tab(index, self.monitoring_widget, "📊 Monitoring")
+        elif index == 2 and self.test_panel is None:
+            self.test_panel = self.create_test_panel()
+            self._replace_tab(index, self.test_panel, "🧪 Tests")
+            # Catch up on log lines buffered before the tab existed
+            self._flush_test_log()
+
+    def _replace_tab(self, index: int, widget: QWidget, label: str):
+        """Swap a placeholder tab for its real widget"""
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, label)
+        self.tab_widget.setCurrentIndex(index)
     
     def create_test_panel(self) -> QWidget:
         """Create test scenarios panel"""
@@ -200,13 +356,7 @@ class VirtualDisplayMainWindow(QMainWindow):
         scenario_layout = QFormLayout(scenario_group)
         
         self.scenario_combo = QComboBox()
-        self.scenario_combo.addItems([
-            "Fonctionnement Normal",
-            "Test USB",
-            "Simulation Paiement", 
-            "Test de Stress",
-            "Simulation Pannes"
-        ])
+        self.scenario_combo.addItems([name for name, _ in _SCENARIOS])
         scenario_layout.addRow("Scénario:", self.scenario_combo)
         
         layout.addWidget(scenario_group)
@@ -230,10 +380,12 @@ class VirtualDisplayMainWindow(QMainWindow):
         self.test_progress.setVisible(False)
         layout.addWidget(self.test_progress)
         
-        # Test results
+        # Test results: bounded document so paint cost stays constant, and
+        # appends buffered into one insert per flush instead of one per line
         self.test_results = QTextEdit()
         self.test_results.setMaximumHeight(200)
         self.test_results.setPlaceholderText("Les résultats de test s'afficheront ici...")
+        self.test_results.document().setMaximumBlockCount(1000)
         layout.addWidget(self.test_results)
         
         layout.addStretch()
@@ -241,72 +393,39 @@ class VirtualDisplayMainWindow(QMainWindow):
         return panel
     
     def setup_menus(self):
-        """Setup application menus"""
+        """Setup application menus from the declarative spec"""
         menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu("&Fichier")
-        
-        save_config_action = QAction("&Sauvegarder Configuration", self)
-        save_config_action.triggered.connect(self.save_configuration)
-        file_menu.addAction(save_config_action)
-        
-        load_config_action = QAction("&Charger Configuration", self)
-        load_config_action.triggered.connect(self.load_configuration)
-        file_menu.addAction(load_config_action)
-        
-        file_menu.addSeparator()
-        
-        export_logs_action = QAction("&Exporter Logs", self)
-        export_logs_action.triggered.connect(self.export_logs)
-        file_menu.addAction(export_logs_action)
-        
-        file_menu.addSeparator()
-        
-        quit_action = QAction("&Quitter", self)
-        quit_action.triggered.connect(self.close)
-        file_menu.addAction(quit_action)
-        
-        # Display menu
-        display_menu = menubar.addMenu("&Afficheurs")
-        
-        add_serial_action = QAction("Ajouter &Série", self)
-        add_serial_action.triggered.connect(self.add_serial_display)
-        display_menu.addAction(add_serial_action)
-        
-        add_usb_action = QAction("Ajouter &USB", self)
-        add_usb_action.triggered.connect(self.add_usb_display)
-        display_menu.addAction(add_usb_action)
-        
-        display_menu.addSeparator()
-        
-        connect_all_action = QAction("&Connecter Tout", self)
-        connect_all_action.triggered.connect(self.connect_all_displays)
-        display_menu.addAction(connect_all_action)
-        
-        disconnect_all_action = QAction("&Déconnecter Tout", self)
-        disconnect_all_action.triggered.connect(self.disconnect_all_displays)
-        display_menu.addAction(disconnect_all_action)
-        
-        # Tools menu
-        tools_menu = menubar.addMenu("&Outils")
-        
-        test_action = QAction("&Test Global", self)
-        test_action.triggered.connect(self.run_global_test)
-        tools_menu.addAction(test_action)
-        
-        tools_menu.addSeparator()
-        
-        clear_logs_action = QAction("&Vider Logs", self)
-        clear_logs_action.triggered.connect(self.clear_logs)
-        tools_menu.addAction(clear_logs_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("&Aide")
-        
-        about_action = QAction("À &Propos", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        self._actions: Dict[str, QAction] = {}
+
+        for menu_title, entries in _MENU_SPEC:
+            menu = menubar.addMenu(menu_title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                label, slot_name = entry
+                action = QAction(label, self)
+                action.triggered.connect(getattr(self, slot_name))
+                menu.addAction(action)
+                self._actions[slot_name] = action
+
+        # Decorate the shared button actions with a theme icon, or keep
+        # the emoji prefix where the platform theme has no match
+        for slot_name, icon_name, emoji in _BUTTON_ACTIONS:
+            action = self._actions[slot_name]
+            icon = _themed_icon(icon_name)
+            if icon.isNull():
+                action.setText(f"{emoji} {action.text()}")
+            else:
+                action.setIcon(icon)
+
+    def _action_button(self, slot_name: str) -> QToolButton:
+        """Create a control button driven by an existing shared QAction"""
+        button = QToolButton()
+        button.setDefaultAction(self._actions[slot_name])
+        button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
+        button.setIconSize(QSize(16, 16))
+        return button
     
     def setup_status_bar(self):
         """Setup status bar"""
@@ -325,54 +444,54 @@ class VirtualDisplayMainWindow(QMainWindow):
         self.display_updated.connect(self.on_display_updated)
     
     def setup_emulator_events(self):
-        """Setup serial emulator event handlers"""
-        self.serial_emulator.on('port-opened', self.on_port_opened)
-        self.serial_emulator.on('port-closed', self.on_port_closed)
-        self.serial_emulator.on('message-sent', self.on_message_sent)
-        self.serial_emulator.on('message-failed', self.on_message_failed)
-        self.serial_emulator.on('display-update', self.on_display_update)
-    
-    def add_serial_display(self):
-        """Add a new serial display"""
-        display_id = f"display_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        # Create configuration with unique port name
+        """Bridge serial emulator events onto the GUI thread"""
+        self._port_opened_sig.connect(self.on_port_opened)
+        self._port_closed_sig.connect(self.on_port_closed)
+        self._message_sent_sig.connect(self.on_message_sent)
+        self._message_failed_sig.connect(self.on_message_failed)
+        self._display_update_sig.connect(self.on_display_update)
+
+        self.serial_emulator.on('port-opened', self._port_opened_sig.emit)
+        self.serial_emulator.on('port-closed', self._port_closed_sig.emit)
+        self.serial_emulator.on('message-sent', self._message_sent_sig.emit)
+        self.serial_emulator.on('message-failed', self._message_failed_sig.emit)
+        self.serial_emulator.on('display-update', self._display_update_sig.emit)
+    
+    def _add_display(self, connection_type: ConnectionType):
+        """Create and register a display of the given connection type"""
+        port_prefix, id_prefix, overrides = _DISPLAY_PROTOS[connection_type]
+        count = self._counters.get(connection_type, 0) + 1
+        self._counters[connection_type] = count
+
+        # monotonic_ns gives collision-free ids without strftime overhead
+        display_id = f"{id_prefix}_{time.monotonic_ns()}"
         config = VirtualDisplayConfig(
-            port_name=f"COM{len(self.displays) + 1}",
-            connection_type=ConnectionType.SERIAL
+            port_name=f"{port_prefix}{count}",
+            connection_type=connection_type,
+            **overrides
         )
-        
+
         display = VirtualDisplay(
             id=display_id,
             config=config
         )
-        
+
         self.displays[display_id] = display
+        self._by_port[config.port_name] = display
         self.create_display_widget(display)
         self.display_added.emit(display_id)
-    
+        self._schedule_status_refresh()
+
+    @Slot()
+    def add_serial_display(self):
+        """Add a new serial display"""
+        self._add_display(ConnectionType.SERIAL)
+
+    @Slot()
     def add_usb_display(self):
         """Add a new USB display"""
-        display_id = f"usb_display_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        # Create USB configuration
-        config = VirtualDisplayConfig(
-            port_name=f"USB{len([d for d in self.displays.values() if d.config.connection_type == ConnectionType.USB]) + 1}",
-            connection_type=ConnectionType.USB,
-            usb_vendor_id="04D8",
-            usb_product_id="000A",
-            theme=DisplayTheme.LCD_BLUE
-        )
-        
-        display = VirtualDisplay(
-            id=display_id,
-            config=config
-        )
-        
-        self.displays[display_id] = display
-        self.create_display_widget(display)
-        self.display_added.emit(display_id)
-    
+        self._add_display(ConnectionType.USB)
+
     def create_display_widget(self, display: VirtualDisplay):
         """Create widget for a display"""
         widget = VirtualDisplayWidget(
@@ -385,33 +504,38 @@ class VirtualDisplayMainWindow(QMainWindow):
         widget.remove_requested.connect(self.remove_display)
         
         self.display_widgets[display.id] = widget
-        
+
         # Add to grid
-        row = len(self.display_widgets) // 3
-        col = len(self.display_widgets) % 3
+        row, col = divmod(self._grid_next, 3)
         self.display_grid_layout.addWidget(widget, row, col)
-        
+        self._grid_next += 1
+
         self.update_empty_state()
     
+    @Slot(str)
     def remove_display(self, display_id: str):
         """Remove a display"""
         if display_id in self.displays:
             # Close connection if active
             display = self.displays[display_id]
             if display.is_active:
-                asyncio.create_task(
+                self._create_task(
                     self.serial_emulator.close_port(display.config.port_name)
                 )
             
             # Remove from UI
             if display_id in self.display_widgets:
                 widget = self.display_widgets[display_id]
+                widget.cleanup()
                 widget.setParent(None)
                 widget.deleteLater()
                 del self.display_widgets[display_id]
             
             # Remove from data
+            if display.is_active:
+                self._active_count -= 1
             del self.displays[display_id]
+            self._by_port.pop(display.config.port_name, None)
             
             # Update selection
             if self.selected_display_id == display_id:
@@ -419,67 +543,115 @@ class VirtualDisplayMainWindow(QMainWindow):
                 self.config_panel.set_display(None)
             
             self.display_removed.emit(display_id)
+            self._reflow_grid()
             self.update_empty_state()
-    
+            self._schedule_status_refresh()
+
+    def _reflow_grid(self):
+        """Compact the display grid after a removal left a hole"""
+        self.display_grid_widget.setUpdatesEnabled(False)
+        try:
+            self._grid_next = 0
+            for widget in self.display_widgets.values():
+                row, col = divmod(self._grid_next, 3)
+                self.display_grid_layout.addWidget(widget, row, col)
+                self._grid_next += 1
+        finally:
+            self.display_grid_widget.setUpdatesEnabled(True)
+    
+    @Slot()
     def connect_all_displays(self):
         """Connect all displays"""
         for display in self.displays.values():
             if not display.is_active:
-                asyncio.create_task(
+                self._create_task(
                     self.serial_emulator.open_port(display.config.port_name, display.config)
                 )
     
+    @Slot()
     def disconnect_all_displays(self):
         """Disconnect all displays"""
         for display in self.displays.values():
             if display.is_active:
-                asyncio.create_task(
+                self._create_task(
                     self.serial_emulator.close_port(display.config.port_name)
                 )
     
+    @Slot()
     def run_global_test(self):
         """Run a global test on all displays"""
         if not self.displays:
-            QMessageBox.information(self, "Test Global", "Aucun afficheur configuré pour le test.")
+            self._show_info("Test Global", "Aucun afficheur configuré pour le test.")
             return
         
-        self.test_results.append(f"🧪 Test global démarré à {datetime.now().strftime('%H:%M:%S')}")
+        self._log(f"🧪 Test global démarré à {datetime.now().strftime('%H:%M:%S')}")
         
         # Send test messages to all connected displays
         for display in self.displays.values():
             if display.is_active:
                 test_message = f"Test {display.config.port_name}"
-                asyncio.create_task(
+                self._create_task(
                     self.serial_emulator.send_message(
                         display.config.port_name, test_message, display.config
                     )
                 )
-                self.test_results.append(f"  📤 {display.config.port_name}: {test_message}")
+                self._log(f"  📤 {display.config.port_name}: {test_message}")
     
+    @Slot()
     def run_selected_test(self):
         """Run the selected test scenario"""
-        scenario = self.scenario_combo.currentText()
-        self.test_results.append(f"🧪 Scénario '{scenario}' démarré...")
-        
+        name, runner = _SCENARIOS[self.scenario_combo.currentIndex()]
+        self._log(f"🧪 Scénario '{name}' démarré...")
+
         self.run_test_btn.setEnabled(False)
         self.stop_test_btn.setEnabled(True)
         self.test_progress.setVisible(True)
         self.test_progress.setValue(0)
-        
-        # TODO: Implement actual test scenarios
-        QTimer.singleShot(2000, self.finish_test)  # Simulate test completion
+
+        getattr(self, runner)()
+
+    def _simulate_test_run(self):
+        """Shared placeholder completion until real scenarios land"""
+        QTimer.singleShot(2000, self.finish_test)
+
+    def _run_normal_scenario(self):
+        """Run the normal-operation scenario"""
+        # TODO: Implement actual scenario
+        self._simulate_test_run()
+
+    def _run_usb_scenario(self):
+        """Run the USB connectivity scenario"""
+        # TODO: Implement actual scenario
+        self._simulate_test_run()
+
+    def _run_payment_scenario(self):
+        """Run the payment-simulation scenario"""
+        # TODO: Implement actual scenario
+        self._simulate_test_run()
+
+    def _run_stress_scenario(self):
+        """Run the stress-test scenario"""
+        # TODO: Implement actual scenario
+        self._simulate_test_run()
+
+    def _run_failure_scenario(self):
+        """Run the failure-simulation scenario"""
+        # TODO: Implement actual scenario
+        self._simulate_test_run()
     
+    @Slot()
     def stop_current_test(self):
         """Stop current test"""
         self.finish_test()
-        self.test_results.append("⏹️ Test interrompu par l'utilisateur")
+        self._log("⏹️ Test interrompu par l'utilisateur")
     
+    @Slot()
     def finish_test(self):
         """Finish current test"""
         self.run_test_btn.setEnabled(True)
         self.stop_test_btn.setEnabled(False)
         self.test_progress.setVisible(False)
-        self.test_results.append("✅ Test terminé")
+        self._log("✅ Test terminé")
     
     def update_empty_state(self):
         """Update empty state visibility"""
@@ -487,21 +659,74 @@ class VirtualDisplayMainWindow(QMainWindow):
         self.empty_state_label.setVisible(not has_displays)
         self.display_grid_widget.setVisible(has_displays)
     
-    def update_displays(self):
-        """Update display widgets"""
-        # Update status bar
-        active_connections = sum(1 for d in self.displays.values() if d.is_active)
-        total_displays = len(self.displays)
-        
-        if active_connections > 0:
-            self.connection_status_label.setText(f"🟢 {active_connections}/{total_displays} connectés")
+    def _log(self, message: str):
+        """Queue a test-log line for the next coalesced flush"""
+        self._log_buffer.append(message)
+        # The flush is a no-op until the Tests tab is built, so cap the
+        # buffer at what the view would keep (its block count limit)
+        # instead of letting it grow for the whole session
+        if len(self._log_buffer) > 1000:
+            del self._log_buffer[:-1000]
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    @Slot()
+    def _flush_test_log(self):
+        """Append all buffered test-log lines in a single document edit"""
+        if self._log_buffer and self.test_panel is not None:
+            self.test_results.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def _show_info(self, title: str, text: str):
+        """Show the shared information dialog"""
+        self._info_box.setWindowTitle(title)
+        self._info_box.setText(text)
+        self._info_box.exec()
+
+    def _create_task(self, coro):
+        """Schedule a coroutine on the Qt-integrated asyncio loop"""
+        task = asyncio.ensure_future(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return task
+
+    @Slot()
+    def _refresh_visible_widgets(self):
+        """Repaint widgets that scrolled into view with stale content"""
+        # Read phase: collect dirty widgets without mutating any Qt state,
+        # so geometry queries below never interleave with invalidations
+        stale = [w for w in self.display_widgets.values() if w.is_stale()]
+        if not stale:
+            return
+
+        # Write phase: batch all repaints into one layout/compositing pass
+        self.display_grid_widget.setUpdatesEnabled(False)
+        try:
+            for widget in stale:
+                widget.refresh_if_stale()
+        finally:
+            self.display_grid_widget.setUpdatesEnabled(True)
+
+    def _schedule_status_refresh(self):
+        """Queue one coalesced status-bar refresh for the next event-loop turn"""
+        if not self._status_refresh_queued:
+            self._status_refresh_queued = True
+            QTimer.singleShot(0, self._refresh_status)
+
+    def _refresh_status(self):
+        """Update the status bar from the event-maintained counters"""
+        self._status_refresh_queued = False
+        status = (self._active_count, len(self.displays))
+        if status == self._last_status:
+            return
+        self._last_status = status
+
+        if self._active_count > 0:
+            self.connection_status_label.setText(f"🟢 {status[0]}/{status[1]} connectés")
         else:
             self.connection_status_label.setText("🔴 Aucune connexion")
-        
-        # Update display widgets
-        for widget in self.display_widgets.values():
-            widget.update_display()
     
+    @Slot(str)
     def on_display_selected(self, display_id: str):
         """Handle display selection"""
         # Deselect previous
@@ -517,108 +742,149 @@ class VirtualDisplayMainWindow(QMainWindow):
         display = self.displays.get(display_id)
         self.config_panel.set_display(display)
     
+    @Slot(object)
     def on_display_config_changed(self, config: VirtualDisplayConfig):
         """Handle display configuration change"""
         if self.selected_display_id and self.selected_display_id in self.displays:
-            self.displays[self.selected_display_id].config = config
-            self.display_updated.emit(self.selected_display_id, asdict(config))
+            display = self.displays[self.selected_display_id]
+            # Keep the port index in sync if the port name was edited
+            if display.config.port_name != config.port_name:
+                self._by_port.pop(display.config.port_name, None)
+                self._by_port[config.port_name] = display
+            display.config = config
+            # Pass the config object itself: asdict() deep-copies every
+            # field on each change, and consumers can read fields directly
+            self.display_updated.emit(self.selected_display_id, config)
     
     # Event handlers
+    @Slot(str)
     def on_display_added(self, display_id: str):
         """Handle display added"""
         pass
     
+    @Slot(str)
     def on_display_removed(self, display_id: str):
         """Handle display removed"""
         pass
     
-    def on_display_updated(self, display_id: str, config: dict):
+    @Slot(str, object)
+    def on_display_updated(self, display_id: str, config: VirtualDisplayConfig):
         """Handle display updated"""
         pass
     
+    @Slot(dict)
     def on_port_opened(self, data: dict):
         """Handle port opened event"""
-        port_name = data.get('port_name')
-        for display in self.displays.values():
-            if display.config.port_name == port_name:
-                display.is_active = True
-                display.last_activity = datetime.now()
-                break
-    
+        display = self._by_port.get(data.get('port_name'))
+        if display:
+            if not display.is_active:
+                self._active_count += 1
+            display.is_active = True
+            display.last_activity = datetime.now()
+        self._schedule_status_refresh()
+
+    @Slot(dict)
     def on_port_closed(self, data: dict):
         """Handle port closed event"""
-        port_name = data.get('port_name')
-        for display in self.displays.values():
-            if display.config.port_name == port_name:
-                display.is_active = False
-                break
+        display = self._by_port.get(data.get('port_name'))
+        if display:
+            if display.is_active:
+                self._active_count -= 1
+            display.is_active = False
+        self._schedule_status_refresh()
     
+    @Slot(dict)
     def on_message_sent(self, data: dict):
         """Handle message sent event"""
         pass
     
+    @Slot(dict)
     def on_message_failed(self, data: dict):
         """Handle message failed event"""
         pass
     
+    @Slot(dict)
     def on_display_update(self, data: dict):
         """Handle display update event"""
-        port_name = data.get('port_name')
-        content = data.get('content', [])
-        
-        for display in self.displays.values():
-            if display.config.port_name == port_name:
-                display.current_content = content
-                display.last_activity = datetime.now()
-                break
+        display = self._by_port.get(data.get('port_name'))
+        if display:
+            display.current_content = data.get('content', [])
+            display.last_activity = datetime.now()
     
+    @Slot()
     def save_configuration(self):
         """Save current configuration"""
         # TODO: Implement configuration saving
-        QMessageBox.information(self, "Sauvegarde", "Configuration sauvegardée avec succès!")
+        self._show_info("Sauvegarde", "Configuration sauvegardée avec succès!")
     
+    @Slot()
     def load_configuration(self):
         """Load configuration from file"""
         # TODO: Implement configuration loading
-        QMessageBox.information(self, "Chargement", "Configuration chargée avec succès!")
+        self._show_info("Chargement", "Configuration chargée avec succès!")
     
+    @Slot()
     def export_logs(self):
         """Export logs to file"""
         # TODO: Implement log export
-        QMessageBox.information(self, "Export", "Logs exportés avec succès!")
+        self._show_info("Export", "Logs exportés avec succès!")
     
+    @Slot()
     def clear_logs(self):
         """Clear monitoring logs"""
-        self.monitoring_widget.clear_logs()
-        QMessageBox.information(self, "Logs", "Logs vidés avec succès!")
+        if self.monitoring_widget is not None:
+            self.monitoring_widget.clear_logs()
+        self._show_info("Logs", "Logs vidés avec succès!")
     
+    @Slot()
     def show_about(self):
         """Show about dialog"""
-        QMessageBox.about(self, "À Propos de VirtualDisplayPy", 
-                         """
-VirtualDisplayPy v1.0.0
-
-Émulateur d'Afficheur Virtuel pour MostaGare
-Développé avec Python et Qt
-
-Fonctionnalités:
-• Émulation afficheurs série et USB
-• Interface graphique intuitive  
-• Monitoring temps réel
-• Tests automatisés
-• Support multi-thèmes
-
-© 2025 MostaGare Development Team
-                         """)
+        if self._about_box is None:
+            self._about_box = QMessageBox(self)
+            self._about_box.setWindowTitle("À Propos de VirtualDisplayPy")
+            self._about_box.setText(_ABOUT_TEXT)
+        self._about_box.exec()
     
     def closeEvent(self, event):
         """Handle window close event"""
-        # Cleanup connections
-        for display in self.displays.values():
-            if display.is_active:
-                asyncio.create_task(
-                    self.serial_emulator.close_port(display.config.port_name)
+        # Close every open port before the window goes away. Under the
+        # qasync loop this slot always runs with the loop already
+        # running, so a blocking run_until_complete here is impossible:
+        # the first close is refused instead, the close tasks drain on
+        # the loop (bounded to 2 s), and the done-callback re-triggers
+        # close() with nothing left to await.
+        if self._close_drained:
+            event.accept()
+            return
+
+        coros = [
+            self.serial_emulator.close_port(display.config.port_name)
+            for display in self.displays.values()
+            if display.is_active
+        ]
+        if not coros:
+            event.accept()
+            return
+
+        async def _shutdown():
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*coros, return_exceptions=True),
+                    timeout=2.0
                 )
-        
-        # Accept close
+            except asyncio.TimeoutError:
+                pass
+
+        self._close_drained = True
+        try:
+            loop = asyncio.get_event_loop()
+            if loop.is_running():
+                event.ignore()
+                task = self._create_task(_shutdown())
+                task.add_done_callback(lambda _task: self.close())
+                return
+            loop.run_until_complete(_shutdown())
+        except Exception:
+            pass
+
         event.accept()
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+🔤 Monitoring Formatters - Hot-path row formatting helpers
+Date: 03/09/2025
+Description: Pure-Python formatting for communications-table rows. Free
+functions over primitive arguments only (no Qt objects), so the
+per-event path can be compiled with mypyc/Cython without changes.
+"""
+
+import sys
+
+# Direction/status glyphs built once; per-event lookups replace
+# conditional string construction on the hot path
+_DIR_GLYPH = {"out": "📤", "in": "📥", "system": "ℹ️"}
+_STATUS_GLYPH = {
+    "success": "✅ Succès",
+    "error": "❌ Erreur",
+    "timeout": "⏱️ Timeout",
+}
+
+# Base "HH:MM:SS" cache: events within the same second reuse the
+# formatted prefix and only the millisecond suffix is rebuilt
+_ts_key = ()
+_ts_base = ""
+
+
+def format_entry(hour: int, minute: int, second: int, microsecond: int,
+                 port_name: str, direction: str, data: str,
+                 status: str) -> tuple:
+    """Format one communications-table row as a 5-tuple of strings"""
+    global _ts_key, _ts_base
+
+    key = (hour, minute, second)
+    if key != _ts_key:
+        _ts_key = key
+        _ts_base = f"{hour:02d}:{minute:02d}:{second:02d}"
+
+    # Short messages (the common case) pass through untouched; long ones
+    # take one slice plus a single-codepoint ellipsis
+    if len(data) > 50:
+        data = f"{data[:50]}…"
+
+    return (
+        f"{_ts_base}.{microsecond // 1000:03d}",
+        # The same few port names recur forever; interning makes the
+        # stored references shared and equality checks pointer-fast
+        sys.intern(port_name),
+        _DIR_GLYPH.get(direction, "📥"),
+        data,
+        _STATUS_GLYPH.get(status, status),
+    )
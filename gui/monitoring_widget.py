@@ -4,50 +4,167 @@ Date: 03/09/2025
 Description: Real-time monitoring of display communications and statistics
 """
 
+import time
+from collections import deque
 from datetime import datetime
-from typing import List, Dict
-
-try:
-    from PySide6.QtWidgets import (
-        QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QLabel,
-        QPushButton, QGroupBox, QTableWidget, QTableWidgetItem,
-        QHeaderView, QSplitter
-    )
-    from PySide6.QtCore import Qt, QTimer
-except ImportError:
-    from PyQt6.QtWidgets import (
-        QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QLabel,
-        QPushButton, QGroupBox, QTableWidget, QTableWidgetItem,
-        QHeaderView, QSplitter
-    )
-    from PyQt6.QtCore import Qt, QTimer
+from functools import lru_cache
+from typing import List, Dict, Optional
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QLabel,
+    QPushButton, QGroupBox, QTableView,
+    QHeaderView, QSplitter
+)
+from PySide6.QtCore import Qt, QTimer, Signal, QAbstractTableModel, QModelIndex
 
 from core.serial_emulator import SerialEmulator
+from gui.monitoring_fmt import format_entry
+
+# Communications table capacity; oldest rows are dropped FIFO past this
+_LOG_CAPACITY = 1000
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_timestamp(raw: str) -> Optional[datetime]:
+    """Parse an ISO timestamp string, memoized for sub-second bursts
+
+    Returns None for a malformed string: caching a datetime.now()
+    fallback would pin that first wall-clock time to the string forever,
+    so the substitution happens at the call site instead.
+    """
+    try:
+        return datetime.fromisoformat(raw.replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        return None
+
+
+class CommLogModel(QAbstractTableModel):
+    """Table model over a bounded deque of pre-formatted row tuples
+
+    Rows are plain 5-tuples of strings, so appends allocate no Qt items
+    and data() only materializes what is visible. The FIFO drop at
+    capacity is O(1) instead of QTableWidget's O(rows) removeRow(0).
+    """
+
+    HEADERS = ("Heure", "Port", "Direction", "Données", "Statut")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: deque = deque(maxlen=_LOG_CAPACITY)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def extend_rows(self, rows: list):
+        """Append a batch of rows in one insert, dropping overflow FIFO"""
+        # A batch larger than the deque capacity would silently drop its
+        # own head inside extend(), desyncing the model from the
+        # announced insert range — keep only the rows that can survive
+        if len(rows) > _LOG_CAPACITY:
+            rows = rows[-_LOG_CAPACITY:]
+        overflow = min(len(self._rows) + len(rows) - _LOG_CAPACITY, len(self._rows))
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.endRemoveRows()
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        """Drop all rows"""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
 
 
 class MonitoringWidget(QWidget):
     """Real-time monitoring widget"""
-    
+
+    # Bridge signals: emulator callbacks may fire from its I/O coroutine,
+    # so events are re-emitted as Qt signals whose (auto-queued)
+    # connections run the handlers on the GUI thread
+    _port_created_sig = Signal(dict)
+    _port_opened_sig = Signal(dict)
+    _port_closed_sig = Signal(dict)
+    _message_sent_sig = Signal(dict)
+    _message_failed_sig = Signal(dict)
+    _stats_changed_sig = Signal(dict)
+
     def __init__(self, serial_emulator: SerialEmulator):
         super().__init__()
         self.serial_emulator = serial_emulator
-        self.communication_log: List[Dict] = []
-        
+
+        # Rows accumulated between flushes; bursts of events commit to
+        # the model as one spanning insert instead of one per event
+        self._pending: List[tuple] = []
+        self._log_pending: List[str] = []
+
+        # Compose-timer pair: the first event in a quiet period is
+        # processed on the next event-loop pass (minimum latency) while
+        # the 16 ms window that follows coalesces the rest of the burst.
+        # No timer runs while idle.
+        self._immediate = QTimer(self)
+        self._immediate.setSingleShot(True)
+        self._immediate.setInterval(0)
+        self._immediate.timeout.connect(self._process_updates)
+        self._delayed = QTimer(self)
+        self._delayed.setSingleShot(True)
+        self._delayed.setInterval(16)
+        self._delayed.timeout.connect(self._process_updates)
+
+        # Formatted-timestamp cache: log lines within the same second
+        # skip the strftime call
+        self._log_ts_sec = -1
+        self._log_ts_str = ""
+
+        # Statistics accumulated from emulator deltas, seeded from the
+        # emulator's own counters so traffic sent before this widget
+        # existed is not lost; the compose-timer flush (and showEvent,
+        # for bursts absorbed while hidden) pushes them to the labels
+        # when dirty
+        snapshot = serial_emulator.get_statistics()
+        successful = snapshot.get('successful_messages', 0)
+        self._stats = {
+            'total': snapshot.get('total_messages', 0),
+            'successful': successful,
+            'failed': snapshot.get('failed_messages', 0),
+            # average_latency is maintained over successful sends, so
+            # the running sum reconstructs from it exactly
+            'lat_sum': snapshot.get('average_latency', 0.0) * successful,
+            'lat_n': successful,
+        }
+        self._stats_dirty = True
+
+        # Last values written to the statistics labels, to skip setText
+        # (and the repaint it triggers) when nothing changed
+        self._last_stats: tuple = ()
+
         self.setup_ui()
         self.setup_monitoring()
-        
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_statistics)
-        self.update_timer.start(1000)  # Update every second
     
     def setup_ui(self):
         """Setup monitoring UI"""
         layout = QVBoxLayout(self)
         
         # Statistics section
-        stats_group = QGroupBox("Statistiques en Temps Réel")
-        stats_layout = QHBoxLayout(stats_group)
+        self.stats_group = QGroupBox("Statistiques en Temps Réel")
+        stats_layout = QHBoxLayout(self.stats_group)
         
         # Messages statistics
         self.total_messages_label = QLabel("Messages: 0")
@@ -61,7 +178,7 @@ class MonitoringWidget(QWidget):
         stats_layout.addWidget(self.avg_latency_label)
         stats_layout.addStretch()
         
-        layout.addWidget(stats_group)
+        layout.addWidget(self.stats_group)
         
         # Splitter for communications table and log
         splitter = QSplitter(Qt.Orientation.Vertical)
@@ -81,18 +198,19 @@ class MonitoringWidget(QWidget):
         
         table_layout.addLayout(table_controls)
         
-        self.communications_table = QTableWidget()
-        self.communications_table.setColumnCount(5)
-        self.communications_table.setHorizontalHeaderLabels([
-            "Heure", "Port", "Direction", "Données", "Statut"
-        ])
-        
-        # Auto-resize columns
+        self.comm_model = CommLogModel(self)
+        self.communications_table = QTableView()
+        self.communications_table.setModel(self.comm_model)
+
+        # Fixed column widths: ResizeToContents rescans column items on
+        # every insert, making insert cost grow with row count
         header = self.communications_table.horizontalHeader()
         header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.communications_table.setColumnWidth(0, 90)
+        self.communications_table.setColumnWidth(1, 80)
+        self.communications_table.setColumnWidth(2, 40)
+        self.communications_table.setColumnWidth(3, 400)
         
         table_layout.addWidget(self.communications_table)
         splitter.addWidget(table_widget)
@@ -111,9 +229,13 @@ class MonitoringWidget(QWidget):
         
         log_layout.addLayout(log_controls)
         
-        self.log_text = QTextEdit()
+        # QPlainTextEdit streams logs without rich-text overhead; the
+        # block cap trims old lines in O(1) inside Qt
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(150)
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(1000)
+        self.log_text.setUndoRedoEnabled(False)
         log_layout.addWidget(self.log_text)
         
         splitter.addWidget(log_widget)
@@ -122,70 +244,142 @@ class MonitoringWidget(QWidget):
         splitter.setSizes([300, 150])
     
     def setup_monitoring(self):
-        """Setup monitoring event handlers"""
-        self.serial_emulator.on('port-opened', self.on_port_opened)
-        self.serial_emulator.on('port-closed', self.on_port_closed)
-        self.serial_emulator.on('message-sent', self.on_message_sent)
-        self.serial_emulator.on('message-failed', self.on_message_failed)
-        self.serial_emulator.on('port-created', self.on_port_created)
+        """Bridge monitoring events onto the GUI thread"""
+        self._port_opened_sig.connect(self.on_port_opened)
+        self._port_closed_sig.connect(self.on_port_closed)
+        self._message_sent_sig.connect(self.on_message_sent)
+        self._message_failed_sig.connect(self.on_message_failed)
+        self._port_created_sig.connect(self.on_port_created)
+        self._stats_changed_sig.connect(self.on_stats_changed)
+
+        self.serial_emulator.on('port-opened', self._port_opened_sig.emit)
+        self.serial_emulator.on('port-closed', self._port_closed_sig.emit)
+        self.serial_emulator.on('message-sent', self._message_sent_sig.emit)
+        self.serial_emulator.on('message-failed', self._message_failed_sig.emit)
+        self.serial_emulator.on('port-created', self._port_created_sig.emit)
+        self.serial_emulator.on('stats-changed', self._stats_changed_sig.emit)
     
+    def on_stats_changed(self, delta: dict):
+        """Accumulate a statistics delta emitted by the emulator"""
+        stats = self._stats
+        stats['total'] += delta.get('total', 0)
+        stats['successful'] += delta.get('successful', 0)
+        stats['failed'] += delta.get('failed', 0)
+        latency = delta.get('latency_ms')
+        if latency is not None:
+            stats['lat_sum'] += latency
+            stats['lat_n'] += 1
+        self._stats_dirty = True
+        self._schedule_update()
+
     def update_statistics(self):
-        """Update statistics display"""
-        stats = self.serial_emulator.get_statistics()
-        
-        self.total_messages_label.setText(f"Messages: {stats.get('total_messages', 0)}")
-        self.successful_messages_label.setText(f"Succès: {stats.get('successful_messages', 0)}")
-        self.failed_messages_label.setText(f"Échecs: {stats.get('failed_messages', 0)}")
-        self.avg_latency_label.setText(f"Latence moy: {stats.get('average_latency', 0):.1f}ms")
+        """Push accumulated statistics to the labels when they changed"""
+        # Hidden tab: counters keep accumulating, labels wait for showEvent
+        if not self._stats_dirty or not self.isVisible():
+            return
+        self._stats_dirty = False
+
+        stats = self._stats
+        average = stats['lat_sum'] / stats['lat_n'] if stats['lat_n'] else 0.0
+        current = (stats['total'], stats['successful'], stats['failed'], average)
+        previous = self._last_stats
+        if current == previous:
+            return
+        self._last_stats = current
+
+        # One layout/repaint pass for the group, touching only the
+        # labels whose value actually moved
+        self.stats_group.setUpdatesEnabled(False)
+        try:
+            if not previous or current[0] != previous[0]:
+                self.total_messages_label.setText(f"Messages: {current[0]}")
+            if not previous or current[1] != previous[1]:
+                self.successful_messages_label.setText(f"Succès: {current[1]}")
+            if not previous or current[2] != previous[2]:
+                self.failed_messages_label.setText(f"Échecs: {current[2]}")
+            if not previous or current[3] != previous[3]:
+                self.avg_latency_label.setText(f"Latence moy: {current[3]:.1f}ms")
+        finally:
+            self.stats_group.setUpdatesEnabled(True)
     
-    def add_communication_entry(self, timestamp: datetime, port_name: str, 
+    def add_communication_entry(self, timestamp: datetime, port_name: str,
                               direction: str, data: str, status: str):
         """Add entry to communications table"""
-        row = self.communications_table.rowCount()
-        self.communications_table.insertRow(row)
-        
-        # Limit table size
-        if row >= 1000:
-            self.communications_table.removeRow(0)
-            row -= 1
-        
-        time_str = timestamp.strftime("%H:%M:%S.%f")[:-3]
-        
-        self.communications_table.setItem(row, 0, QTableWidgetItem(time_str))
-        self.communications_table.setItem(row, 1, QTableWidgetItem(port_name))
-        self.communications_table.setItem(row, 2, QTableWidgetItem("📤" if direction == "out" else "📥"))
-        self.communications_table.setItem(row, 3, QTableWidgetItem(data[:50] + "..." if len(data) > 50 else data))
-        
-        # Status with color
-        status_item = QTableWidgetItem(status)
-        if status == "success":
-            status_item.setText("✅ Succès")
-        elif status == "error":
-            status_item.setText("❌ Erreur")
-        elif status == "timeout":
-            status_item.setText("⏱️ Timeout")
-        
-        self.communications_table.setItem(row, 4, status_item)
-        
-        # Scroll to bottom
-        self.communications_table.scrollToBottom()
+        self._pending.append(format_entry(
+            timestamp.hour, timestamp.minute, timestamp.second,
+            timestamp.microsecond,
+            port_name, direction, data, status
+        ))
+        self._schedule_update()
+
+    def _schedule_update(self):
+        """Schedule a coalesced refresh for pending rows/logs/stats
+
+        The first event in a quiet period fires on the next event-loop
+        pass; anything arriving inside the 16 ms window that follows is
+        absorbed into that or the trailing flush.
+        """
+        if self._delayed.isActive():
+            return
+        self._immediate.start()
+        self._delayed.start()
+
+    def _process_updates(self):
+        """Apply all queued monitoring updates in one pass"""
+        self._flush_pending()
+        self.update_statistics()
+
+    def showEvent(self, event):
+        """Drain updates buffered while the tab was hidden"""
+        super().showEvent(event)
+        self._process_updates()
+
+    def _flush_pending(self):
+        """Commit queued table rows and log lines in one pass each"""
+        if not self.isVisible():
+            # Keep buffering while hidden, bounded so a background flood
+            # cannot grow the queues past what the views would keep
+            if len(self._pending) > _LOG_CAPACITY:
+                del self._pending[:-_LOG_CAPACITY]
+            if len(self._log_pending) > _LOG_CAPACITY:
+                del self._log_pending[:-_LOG_CAPACITY]
+            return
+
+        if self._pending:
+            rows = self._pending
+            self._pending = []
+
+            # Only keep following the tail if the user was already there;
+            # scrolling away to inspect older rows is respected
+            scrollbar = self.communications_table.verticalScrollBar()
+            follow = scrollbar.value() >= scrollbar.maximum() - 4
+
+            self.communications_table.setUpdatesEnabled(False)
+            try:
+                self.comm_model.extend_rows(rows)
+            finally:
+                self.communications_table.setUpdatesEnabled(True)
+
+            if follow:
+                self.communications_table.scrollToBottom()
+
+        if self._log_pending:
+            lines = self._log_pending
+            self._log_pending = []
+            self.log_text.appendPlainText("\n".join(lines))
     
     def add_log_entry(self, message: str):
         """Add entry to detailed log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
-        
-        # Limit log size
-        if self.log_text.document().lineCount() > 1000:
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(cursor.Start)
-            cursor.movePosition(cursor.Down, cursor.KeepAnchor, 100)
-            cursor.removeSelectedText()
+        second = int(time.time())
+        if second != self._log_ts_sec:
+            self._log_ts_sec = second
+            self._log_ts_str = time.strftime("%H:%M:%S")
+        self._log_pending.append(f"[{self._log_ts_str}] {message}")
+        self._schedule_update()
     
     def clear_table(self):
         """Clear communications table"""
-        self.communications_table.setRowCount(0)
-        self.communication_log.clear()
+        self.comm_model.clear()
     
     def clear_log(self):
         """Clear detailed log"""
@@ -226,11 +420,10 @@ class MonitoringWidget(QWidget):
         timestamp_str = data.get('timestamp')
         
         if isinstance(timestamp_str, str):
-            # Parse timestamp if it's a string
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            except:
-                timestamp = datetime.now()
+            timestamp = _parse_iso_timestamp(timestamp_str) or datetime.now()
+        elif isinstance(timestamp_str, (int, float)):
+            # Epoch floats are the cheapest contract an emitter can use
+            timestamp = datetime.fromtimestamp(timestamp_str)
         else:
             timestamp = timestamp_str or datetime.now()
         
@@ -249,9 +442,8 @@ class MonitoringWidget(QWidget):
         
         timestamp = comm_data.get('timestamp', datetime.now())
         if isinstance(timestamp, str):
-            try:
-                timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            except:
-                timestamp = datetime.now()
+            timestamp = _parse_iso_timestamp(timestamp) or datetime.now()
+        elif isinstance(timestamp, (int, float)):
+            timestamp = datetime.fromtimestamp(timestamp)
         
         self.add_communication_entry(timestamp, port_name, "out", message, "error")
\ No newline at end of file
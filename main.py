@@ -9,7 +9,7 @@ import sys
 import os
 import logging
 import argparse
-import asyncio
+import importlib.util
 from pathlib import Path
 from typing import Optional
 
@@ -17,22 +17,12 @@ from typing import Optional
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-try:
-    from PySide6.QtWidgets import QApplication
-    from PySide6.QtCore import QTimer
-    from PySide6.QtGui import QIcon
-    QT_AVAILABLE = True
-except ImportError:
-    try:
-        from PyQt6.QtWidgets import QApplication
-        from PyQt6.QtCore import QTimer
-        from PyQt6.QtGui import QIcon
-        QT_AVAILABLE = True
-    except ImportError:
-        QT_AVAILABLE = False
-
-from core.serial_emulator import SerialEmulator
-from core.display_renderer import DisplayRenderer
+# Probe for PySide6 without importing it: the actual import (tens of
+# MB, hundreds of ms) is deferred to run_gui so --version/--console
+# runs never pay for it. asyncio and the core components are likewise
+# imported on first use. The GUI modules are PySide6-only (gui/_qt.py),
+# so a PyQt6-only install falls back to console mode here.
+QT_AVAILABLE = importlib.util.find_spec("PySide6") is not None
 
 
 class VirtualDisplayApp:
@@ -40,12 +30,13 @@ class VirtualDisplayApp:
     
     def __init__(self, debug: bool = False):
         self.debug = debug
+        self._log_listener = None
         self.setup_logging()
         
-        # Core components
-        self.serial_emulator: Optional[SerialEmulator] = None
-        self.display_renderer: Optional[DisplayRenderer] = None
-        self.qt_app: Optional[QApplication] = None
+        # Core components (types imported lazily)
+        self.serial_emulator = None
+        self.display_renderer = None
+        self.qt_app = None
         
         # Configuration
         self.config_dir = project_root / "config"
@@ -56,17 +47,31 @@ class VirtualDisplayApp:
     
     def setup_logging(self):
         """Configure logging system"""
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+
         log_level = logging.DEBUG if self.debug else logging.INFO
-        
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler(project_root / "virtualdisplay.log")
-            ]
+
+        # Hot-path logging calls only enqueue the record; the stream and
+        # file handlers run on the listener's background thread so event
+        # callbacks never block on disk I/O
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+        file_handler = logging.FileHandler(project_root / "virtualdisplay.log")
+        file_handler.setFormatter(formatter)
+
+        log_queue = queue.SimpleQueue()
+        root_logger = logging.getLogger()
+        root_logger.setLevel(log_level)
+        root_logger.addHandler(QueueHandler(log_queue))
+
+        self._log_listener = QueueListener(
+            log_queue, stream_handler, file_handler,
+            respect_handler_level=True
         )
-        
+        self._log_listener.start()
+
         # Reduce noise from some libraries
         logging.getLogger('PIL').setLevel(logging.WARNING)
         logging.getLogger('matplotlib').setLevel(logging.WARNING)
@@ -74,6 +79,9 @@ class VirtualDisplayApp:
     def initialize_core_components(self):
         """Initialize core emulation components"""
         try:
+            from core.serial_emulator import SerialEmulator
+            from core.display_renderer import DisplayRenderer
+
             self.logger.info("Initializing serial emulator...")
             self.serial_emulator = SerialEmulator()
             
@@ -83,22 +91,37 @@ class VirtualDisplayApp:
             self.logger.info("Core components initialized successfully")
             return True
             
-        except Exception as e:
-            self.logger.error(f"Failed to initialize core components: {e}")
+        except Exception:
+            self.logger.exception("Failed to initialize core components")
             return False
     
     def run_gui(self) -> int:
         """Run the Qt GUI application"""
         if not QT_AVAILABLE:
-            self.logger.error("Qt not available. Please install PySide6 or PyQt6")
+            self.logger.error("Qt not available. Please install PySide6")
             return 1
-        
+
+        global asyncio
+        import asyncio
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtGui import QIcon
+
+        try:
+            from qasync import QEventLoop
+            qasync_available = True
+        except ImportError:
+            qasync_available = False
+
         try:
             # Create Qt application
             self.qt_app = QApplication(sys.argv)
             self.qt_app.setApplicationName("VirtualDisplayPy")
             self.qt_app.setApplicationVersion("1.0.0")
             self.qt_app.setOrganizationName("MostaGare")
+
+            # Application-wide stylesheet (parsed once for all display widgets)
+            from gui.display_widget import APPLICATION_QSS
+            self.qt_app.setStyleSheet(APPLICATION_QSS)
             
             # Set application icon if available
             icon_path = project_root / "resources" / "icons" / "app_icon.png"
@@ -124,13 +147,21 @@ class VirtualDisplayApp:
             self.qt_app.aboutToQuit.connect(self.cleanup)
             
             self.logger.info("GUI application started")
+
+            # Run Qt and asyncio on one integrated loop so coroutines
+            # launched from slots actually execute
+            if qasync_available:
+                loop = QEventLoop(self.qt_app)
+                asyncio.set_event_loop(loop)
+                with loop:
+                    loop.run_forever()
+                return 0
+
+            self.logger.warning("qasync not installed - async slots will not run")
             return self.qt_app.exec()
             
-        except Exception as e:
-            self.logger.error(f"Error running GUI application: {e}")
-            if self.debug:
-                import traceback
-                traceback.print_exc()
+        except Exception:
+            self.logger.exception("Error running GUI application")
             return 1
     
     def run_console(self) -> int:
@@ -152,13 +183,16 @@ class VirtualDisplayApp:
             
             return console.run()
             
-        except Exception as e:
-            self.logger.error(f"Error in console mode: {e}")
+        except Exception:
+            self.logger.exception("Error in console mode")
             return 1
     
     def run_tests(self) -> int:
         """Run automated tests"""
         try:
+            global asyncio
+            import asyncio
+
             self.logger.info("Running automated tests...")
             
             # Initialize core components
@@ -175,8 +209,8 @@ class VirtualDisplayApp:
             success = asyncio.run(test_runner.run_all_tests())
             return 0 if success else 1
             
-        except Exception as e:
-            self.logger.error(f"Error running tests: {e}")
+        except Exception:
+            self.logger.exception("Error running tests")
             return 1
     
     def cleanup(self):
@@ -189,27 +223,36 @@ class VirtualDisplayApp:
             
             if self.display_renderer:
                 self.display_renderer.clear_cache()
-                
+
             self.logger.info("Cleanup completed")
-            
-        except Exception as e:
-            self.logger.error(f"Error during cleanup: {e}")
+
+        except Exception:
+            self.logger.exception("Error during cleanup")
+        finally:
+            if self._log_listener is not None:
+                self._log_listener.stop()
+                self._log_listener = None
 
 
-def create_console_interface():
+def create_console_interface(app: VirtualDisplayApp):
     """Create a simple console interface for testing without Qt"""
+    global asyncio
+    import asyncio
     import cmd
     import json
     from models.display_config import DEFAULT_DISPLAY_CONFIG, DEFAULT_USB_CONFIG
-    
+
     class VirtualDisplayConsole(cmd.Cmd):
         intro = "VirtualDisplay Console Interface. Type help or ? to list commands."
         prompt = "(virtualdisplay) "
-        
-        def __init__(self):
+
+        def __init__(self, app: VirtualDisplayApp):
             super().__init__()
-            self.app = VirtualDisplayApp(debug=True)
-            self.app.initialize_core_components()
+            # Reuse the caller's application instead of constructing a
+            # second emulator/renderer pair (and a second log file)
+            self.app = app
+            if self.app.serial_emulator is None:
+                self.app.initialize_core_components()
             self.displays = {}
         
         def do_create_serial(self, line):
@@ -315,7 +358,7 @@ def create_console_interface():
             """Exit the application"""
             return self.do_quit(line)
     
-    return VirtualDisplayConsole()
+    return VirtualDisplayConsole(app)
 
 
 def main():
@@ -355,7 +398,7 @@ Examples:
                 print()
             
             # Create simple console interface
-            console = create_console_interface()
+            console = create_console_interface(app)
             console.cmdloop()
             return 0
         else:
@@ -365,11 +408,8 @@ Examples:
         print("\n🛑 Interrupted by user")
         app.cleanup()
         return 0
-    except Exception as e:
-        print(f"💥 Fatal error: {e}")
-        if args.debug:
-            import traceback
-            traceback.print_exc()
+    except Exception:
+        app.logger.exception("💥 Fatal error")
         return 1
 
 
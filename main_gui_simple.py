@@ -5,10 +5,22 @@ Date: 03/09/2025
 Description: Simple working GUI demo for VirtualDisplayPy
 """
 
+import os
 import sys
+import time
+import struct
 import asyncio
+import tempfile
+from collections import deque
+from itertools import chain, islice, repeat
 from pathlib import Path
 
+# Local-socket frame header: 1-byte port-name length + 2-byte big-endian
+# message length, followed by the UTF-8 port name and message. Fixed
+# offsets instead of newline/pipe scanning, and no malformed-line
+# exception path.
+_FRAME_HEADER = struct.Struct(">BH")
+
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -16,22 +28,14 @@ sys.path.insert(0, str(project_root))
 try:
     from PySide6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-        QPushButton, QLabel, QTextEdit, QGroupBox, QMessageBox
+        QPushButton, QLabel, QPlainTextEdit, QGroupBox, QMessageBox
     )
-    from PySide6.QtCore import Qt, QTimer, Signal
+    from PySide6.QtCore import Qt, QTimer, Signal, QFileSystemWatcher
     from PySide6.QtGui import QFont
+    from PySide6.QtNetwork import QLocalServer
     QT_AVAILABLE = True
 except ImportError:
-    try:
-        from PyQt6.QtWidgets import (
-            QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-            QPushButton, QLabel, QTextEdit, QGroupBox, QMessageBox
-        )
-        from PyQt6.QtCore import Qt, QTimer, pyqtSignal as Signal
-        from PyQt6.QtGui import QFont
-        QT_AVAILABLE = True
-    except ImportError:
-        QT_AVAILABLE = False
+    QT_AVAILABLE = False
 
 if QT_AVAILABLE:
     from core.serial_emulator import SerialEmulator
@@ -50,16 +54,39 @@ class SimpleVirtualDisplayGUI(QMainWindow):
         self.serial_emulator = SerialEmulator()
         self.display_renderer = DisplayRenderer()
         self.current_displays = {}
+
+        # Pre-rendered content block per port plus the set of ports
+        # whose content changed since the last status refresh; only
+        # dirty blocks are rebuilt and the content pane is untouched
+        # when nothing changed
+        self._display_blocks = {}
+        self._dirty_ports = set()
+
+        # Log lines are queued and flushed in one append per 100 ms
+        # window, so a burst of events costs a single repaint
+        self._log_queue = deque()
+        self._log_flush_pending = False
+
+        # Fingerprint of the last rendered status line; idle ticks
+        # degenerate to one tuple compare instead of a label rebuild
+        self._last_stats_key = None
+
+        # One persistent event loop shared by every *_sync helper —
+        # creating and tearing down a loop per call is far more
+        # expensive than the emulator operations themselves
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
         
         # Setup message reception from external apps
         self.setup_external_message_listener()
         
         self.setup_ui()
         
-        # Update timer
+        # Update timer — armed only once a display exists and paused
+        # while the window is hidden, so the dominant idle state costs
+        # no timer wakeups at all
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(1000)
     
     def setup_ui(self):
         """Setup the UI"""
@@ -114,10 +141,11 @@ class SimpleVirtualDisplayGUI(QMainWindow):
         displays_group = QGroupBox("Contenu des Afficheurs")
         displays_layout = QVBoxLayout(displays_group)
         
-        self.displays_content = QTextEdit()
+        self.displays_content = QPlainTextEdit()
         self.displays_content.setMaximumHeight(150)
         self.displays_content.setFont(QFont("Courier", 9))
-        self.displays_content.setStyleSheet("QTextEdit { background-color: #001100; color: #00ff00; }")
+        self.displays_content.setStyleSheet("QPlainTextEdit { background-color: #001100; color: #00ff00; }")
+        self.displays_content.setPlainText("Aucun message affiché sur les displays")
         displays_layout.addWidget(self.displays_content)
         
         layout.addWidget(displays_group)
@@ -126,9 +154,12 @@ class SimpleVirtualDisplayGUI(QMainWindow):
         log_group = QGroupBox("Journal d'Activité")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(200)
         self.log_text.setFont(QFont("Courier", 9))
+        # Flat line model with O(1) appends; the cap keeps long-running
+        # sessions from growing the document without bound
+        self.log_text.setMaximumBlockCount(500)
         log_layout.addWidget(self.log_text)
         
         layout.addWidget(log_group)
@@ -140,10 +171,21 @@ class SimpleVirtualDisplayGUI(QMainWindow):
         self.log_message("🚀 Prêt à créer des afficheurs virtuels")
     
     def log_message(self, message: str):
-        """Add message to log"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        """Queue a message for the activity log"""
+        # time.strftime is a single C call — no datetime object built
+        # just to extract HH:MM:SS
+        timestamp = time.strftime("%H:%M:%S")
+        self._log_queue.append(f"[{timestamp}] {message}")
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(100, self._flush_log)
+
+    def _flush_log(self):
+        """Append all queued log lines in one document mutation"""
+        if self._log_queue:
+            self.log_text.appendPlainText("\n".join(self._log_queue))
+            self._log_queue.clear()
+        self._log_flush_pending = False
     
     def create_serial_display(self):
         """Create a serial display"""
@@ -191,29 +233,26 @@ class SimpleVirtualDisplayGUI(QMainWindow):
         """Create display synchronously"""
         try:
             # Create virtual port
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            success = loop.run_until_complete(
+            success = self._loop.run_until_complete(
                 self.serial_emulator.create_virtual_port(config)
             )
-            
+
             if success:
                 self.log_message(f"✅ Port {config.port_name} créé ({config.connection_type.value})")
-                
+
                 # Open port
-                loop.run_until_complete(
+                self._loop.run_until_complete(
                     self.serial_emulator.open_port(config.port_name, config)
                 )
                 self.current_displays[config.port_name] = config
+                self._dirty_ports.add(config.port_name)
                 self.log_message(f"🔌 Port {config.port_name} ouvert")
-                
+
+                if not self.update_timer.isActive():
+                    self.update_timer.start(1000)
                 self.update_status()
             else:
                 self.log_message(f"❌ Échec création port {config.port_name}")
-                
-            loop.close()
         except Exception as e:
             self.log_message(f"💥 Erreur: {str(e)}")
     
@@ -223,93 +262,195 @@ class SimpleVirtualDisplayGUI(QMainWindow):
             QMessageBox.information(self, "Test", "Aucun afficheur disponible")
             return
         
-        from datetime import datetime
-        
-        message = f"Test {datetime.now().strftime('%H:%M:%S')}"
-        
-        for port_name, config in self.current_displays.items():
-            self.send_message_sync(port_name, message, config)
+        message = f"Test {time.strftime('%H:%M:%S')}"
+        self._broadcast_sync(message)
+
+    def _broadcast_sync(self, message: str):
+        """Send one message to every display concurrently"""
+        # gather issues all per-port sends at once, so total latency is
+        # the slowest port instead of the sum of all of them
+        try:
+            self._loop.run_until_complete(asyncio.gather(*(
+                self.serial_emulator.send_message(port_name, message, config)
+                for port_name, config in self.current_displays.items()
+            )))
+        except Exception as e:
+            self.log_message(f"❌ Erreur envoi: {str(e)}")
+        else:
+            self._dirty_ports.update(self.current_displays)
+            self.log_message(
+                f"📤 Message envoyé vers {len(self.current_displays)} afficheur(s): {message}"
+            )
+        self.update_status()
     
     def send_message_sync(self, port_name: str, message: str, config: VirtualDisplayConfig):
         """Send message synchronously"""
         try:
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            loop.run_until_complete(
+            self._loop.run_until_complete(
                 self.serial_emulator.send_message(port_name, message, config)
             )
+            self._dirty_ports.add(port_name)
             self.log_message(f"📤 Message envoyé vers {port_name}: {message}")
-            loop.close()
         except Exception as e:
             self.log_message(f"❌ Erreur envoi vers {port_name}: {str(e)}")
     
     def clear_displays(self):
-        """Clear all displays"""        
-        for port_name, config in self.current_displays.items():
-            self.send_message_sync(port_name, "", config)
-        
+        """Clear all displays"""
+        self._broadcast_sync("")
         self.log_message("🗑️ Tous les afficheurs effacés")
     
+    def hideEvent(self, event):
+        """Pause the refresh timer while the window is hidden"""
+        self.update_timer.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        """Resume the refresh timer when the window is shown again"""
+        super().showEvent(event)
+        if self.current_displays and not self.update_timer.isActive():
+            self.update_timer.start(1000)
+
     def update_status(self):
         """Update status display"""
+        if not self.isVisible():
+            return
+
         count = len(self.current_displays)
-        if count == 0:
-            status = "Aucun afficheur connecté"
-        else:
-            ports = ", ".join(self.current_displays.keys())
-            status = f"{count} afficheur(s) connecté(s): {ports}"
-        
-        # Get statistics
         stats = self.serial_emulator.get_statistics()
-        status += f" | Messages: {stats.get('total_messages', 0)}"
-        status += f" | Succès: {stats.get('successful_messages', 0)}"
-        status += f" | Latence: {stats.get('average_latency', 0):.1f}ms"
-        
-        self.status_label.setText(status)
-        
-        # Update display content
-        content_text = ""
-        for port_name in self.current_displays.keys():
-            display_content = self.serial_emulator.get_display_content(port_name)
-            if display_content and any(line.strip() for line in display_content):
-                content_text += f"📟 {port_name}:\n"
-                for line in display_content:
-                    content_text += f"  {line}\n"
-                content_text += "\n"
-        
-        if not content_text:
-            content_text = "Aucun message affiché sur les displays"
-        
-        self.displays_content.setPlainText(content_text)
+        stats_key = (
+            count,
+            stats.get('total_messages', 0),
+            stats.get('successful_messages', 0),
+            round(stats.get('average_latency', 0), 1),
+            tuple(self.current_displays),
+        )
+
+        # Rebuild the label only when something in it actually changed
+        if stats_key != self._last_stats_key:
+            self._last_stats_key = stats_key
+
+            if count == 0:
+                status = "Aucun afficheur connecté"
+            else:
+                ports = ", ".join(self.current_displays.keys())
+                status = f"{count} afficheur(s) connecté(s): {ports}"
+
+            status += f" | Messages: {stats.get('total_messages', 0)}"
+            status += f" | Succès: {stats.get('successful_messages', 0)}"
+            status += f" | Latence: {stats.get('average_latency', 0):.1f}ms"
+
+            self.status_label.setText(status)
+
+        # Rebuild only the blocks whose port changed since last refresh
+        # and leave the pane untouched when nothing did
+        if self._dirty_ports:
+            for port_name in self._dirty_ports:
+                display_content = self.serial_emulator.get_display_content(port_name)
+                if display_content and any(line.strip() for line in display_content):
+                    self._display_blocks[port_name] = (
+                        f"📟 {port_name}:\n"
+                        + "\n".join(f"  {line}" for line in display_content)
+                    )
+                else:
+                    self._display_blocks.pop(port_name, None)
+            self._dirty_ports.clear()
+
+            self.displays_content.setPlainText(
+                "\n\n".join(self._display_blocks.values())
+                or "Aucun message affiché sur les displays"
+            )
     
     def closeEvent(self, event):
         """Handle window close"""
+        # Close every port through the emulator before tearing it down
+        # so per-port shutdown actually completes, bounded to a second
+        # worst case
+        if self.current_displays:
+            shutdown = asyncio.wait_for(
+                asyncio.gather(
+                    *(self.serial_emulator.close_port(port)
+                      for port in list(self.current_displays)),
+                    return_exceptions=True,
+                ),
+                timeout=1.0,
+            )
+            try:
+                self._loop.run_until_complete(shutdown)
+            except asyncio.TimeoutError:
+                pass
+
         self.serial_emulator.destroy()
         self.display_renderer.clear_cache()
+        self._loop.close()
         event.accept()
     
     def setup_external_message_listener(self):
         """Setup listener for external messages"""
-        import tempfile
-        import os
-        
         # Create message file path
         self.message_file = os.path.join(tempfile.gettempdir(), "virtualdisplay_messages.txt")
-        
-        # File watcher timer
-        self.file_watcher_timer = QTimer()
-        self.file_watcher_timer.timeout.connect(self.check_external_messages)
-        self.file_watcher_timer.start(500)  # Check every 500ms
-        
+
+        # Push notifications instead of a 500 ms poll: the OS wakes us
+        # only when a sender actually touches the file, so idle cost is
+        # zero and delivery latency drops from up to 500 ms to ~0
+        if not os.path.exists(self.message_file):
+            open(self.message_file, 'a').close()
+        self.file_watcher = QFileSystemWatcher([self.message_file])
+        self.file_watcher.fileChanged.connect(self.on_message_file_changed)
+
         # Track last modification time
         self.last_message_mtime = 0
+
+        # Local-socket IPC: a sender connecting to this name gets its
+        # messages pushed straight into the GUI without touching disk.
+        # The temp-file watcher above remains as a fallback for the
+        # existing file-based sender scripts.
+        QLocalServer.removeServer("virtualdisplay")
+        self.ipc_server = QLocalServer(self)
+        self.ipc_server.newConnection.connect(self.on_ipc_connection)
+        self.ipc_server.listen("virtualdisplay")
+
+    def on_ipc_connection(self):
+        """Accept pending local-socket sender connections"""
+        while self.ipc_server.hasPendingConnections():
+            socket = self.ipc_server.nextPendingConnection()
+            buffer = bytearray()
+            socket.readyRead.connect(
+                lambda s=socket, b=buffer: self.on_ipc_data(s, b)
+            )
+            socket.disconnected.connect(socket.deleteLater)
+
+    def on_ipc_data(self, socket, buffer: bytearray):
+        """Decode length-prefixed frames received over the local socket"""
+        buffer += bytes(socket.readAll())
+
+        pairs = []
+        offset = 0
+        while len(buffer) - offset >= _FRAME_HEADER.size:
+            port_len, msg_len = _FRAME_HEADER.unpack_from(buffer, offset)
+            end = offset + _FRAME_HEADER.size + port_len + msg_len
+            if len(buffer) < end:
+                break  # partial frame — wait for the next readyRead
+            body = offset + _FRAME_HEADER.size
+            pairs.append((
+                buffer[body:body + port_len].decode('utf-8'),
+                buffer[body + port_len:end].decode('utf-8'),
+            ))
+            offset = end
+
+        del buffer[:offset]
+        if pairs:
+            self._process_external_batch(pairs)
+
+    def on_message_file_changed(self, path: str):
+        """Handle a change notification on the message file"""
+        # Some platforms drop the watch when the file is replaced or
+        # truncated; re-arm it so later writes keep notifying
+        if path not in self.file_watcher.files():
+            self.file_watcher.addPath(path)
+        self.check_external_messages()
     
     def check_external_messages(self):
         """Check for new external messages"""
-        import os
-        
         try:
             if not os.path.exists(self.message_file):
                 return
@@ -326,54 +467,55 @@ class SimpleVirtualDisplayGUI(QMainWindow):
                 content = f.read().strip()
             
             if content:
-                lines = content.split('\n')
-                for line in lines:
-                    if '|' in line:
-                        try:
-                            port, message = line.split('|', 1)
-                            self.process_external_message(port.strip(), message.strip())
-                        except:
-                            pass
-                
+                self._process_external_batch(
+                    line.split('|', 1)
+                    for line in content.split('\n') if '|' in line
+                )
+
                 # Clear the file after processing
                 open(self.message_file, 'w').close()
-                
+
         except Exception as e:
             pass  # Silently ignore file access errors
-    
-    def process_external_message(self, port_name: str, message: str):
-        """Process message from external application"""
-        if port_name in self.current_displays:
-            # Update the display content directly
-            config = self.current_displays[port_name]
-            
-            # Store the message in the serial emulator
-            lines = message.split('\n')
-            if len(lines) > config.display_lines:
-                lines = lines[:config.display_lines]
-            
-            # Pad with empty lines if needed
-            while len(lines) < config.display_lines:
-                lines.append("")
-            
-            # Truncate lines to display width
-            for i, line in enumerate(lines):
-                if len(line) > config.line_length:
-                    lines[i] = line[:config.line_length]
-            
-            # Store in serial emulator
-            self.serial_emulator.display_content[port_name] = lines
-            
-            # Log the message
-            self.log_message(f"📥 Message externe reçu sur {port_name}: {message}")
-            
-            # Force update the display
+
+    def _process_external_batch(self, pairs):
+        """Apply a burst of (port, message) updates with one repaint"""
+        applied = False
+        # One status/content rebuild per burst instead of one per
+        # message; log lines coalesce through the 100 ms flush queue
+        for port, message in pairs:
+            port, message = port.strip(), message.strip()
+            if self._apply_external_message(port, message):
+                self.log_message(f"📥 Message externe reçu sur {port}: {message}")
+                applied = True
+
+        if applied:
             self.update_status()
 
+    def _apply_external_message(self, port_name: str, message: str) -> bool:
+        """Store one external message in the emulator's display content"""
+        if port_name not in self.current_displays:
+            return False
+
+        config = self.current_displays[port_name]
+
+        # Truncate to the display geometry and pad with empty lines in
+        # a single pass: islice caps the line count, the infinite
+        # repeat('') supplies the padding
+        width, height = config.line_length, config.display_lines
+        lines = [
+            line[:width] if len(line) > width else line
+            for line in islice(chain(message.split('\n'), repeat('')), height)
+        ]
+
+        self.serial_emulator.display_content[port_name] = lines
+        self._dirty_ports.add(port_name)
+        return True
+
 def main():
     """Main entry point"""
     if not QT_AVAILABLE:
-        print("❌ Qt non disponible. Installez PySide6 ou PyQt6")
+        print("❌ Qt non disponible. Installez PySide6")
         print("   pip install PySide6")
         return 1
     
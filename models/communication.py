@@ -4,19 +4,26 @@ Date: 03/09/2025
 Description: Communication and protocol models for virtual displays
 """
 
-from dataclasses import dataclass, field
+import string
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional, Literal, Union
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 
 
-class CommunicationDirection(Enum):
+# StrEnum members ARE their string values, so equality checks and dict
+# lookups on the per-message dispatch path run as C-level string
+# compares instead of Enum.__eq__, and serialization needs no .value
+# indirection
+
+class CommunicationDirection(StrEnum):
     """Direction of communication"""
     IN = "in"
     OUT = "out"
 
 
-class CommunicationStatus(Enum):
+class CommunicationStatus(StrEnum):
     """Status of communication"""
     SUCCESS = "success"
     ERROR = "error"
@@ -24,7 +31,7 @@ class CommunicationStatus(Enum):
     CORRUPTED = "corrupted"
 
 
-class CommandType(Enum):
+class CommandType(StrEnum):
     """Types of display commands"""
     CLEAR = "clear"
     WRITE = "write"
@@ -33,7 +40,7 @@ class CommandType(Enum):
     CONFIG = "config"
 
 
-class CommandStatus(Enum):
+class CommandStatus(StrEnum):
     """Status of command execution"""
     PENDING = "pending"
     EXECUTING = "executing"
@@ -41,7 +48,7 @@ class CommandStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class TextFormatting:
     """Text formatting options"""
     bold: bool = False
@@ -52,14 +59,23 @@ class TextFormatting:
     alignment: Literal["left", "center", "right"] = "left"
 
 
-@dataclass
-class Communication:
-    """Serial communication record"""
+@dataclass(slots=True)
+class _RecordBase:
+    """Shared identity fields for the logged record types"""
     id: str
     timestamp: datetime
     port_name: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the record as a flat field dict"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class Communication(_RecordBase):
+    """Serial communication record"""
     direction: CommunicationDirection
-    
+
     # Data
     data: str
     raw_data: bytes
@@ -80,15 +96,12 @@ class Communication:
     connection_params: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
-class DisplayCommand:
+@dataclass(slots=True)
+class DisplayCommand(_RecordBase):
     """Display command structure"""
-    id: str
     type: CommandType
     data: Union[str, bytes]
-    port_name: str
-    timestamp: datetime
-    
+
     # Command parameters
     line: Optional[int] = None
     column: Optional[int] = None
@@ -106,12 +119,9 @@ class DisplayCommand:
     network_address: Optional[str] = None
 
 
-@dataclass
-class ErrorRecord:
+@dataclass(slots=True)
+class ErrorRecord(_RecordBase):
     """Error record for troubleshooting"""
-    id: str
-    timestamp: datetime
-    port_name: str
     error_type: str
     message: str
     details: Dict[str, Any]
@@ -127,7 +137,7 @@ class ErrorRecord:
     connection_info: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentData:
     """Payment data for MostaGare displays"""
     destination: str
@@ -144,7 +154,7 @@ class PaymentData:
     seat_number: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class USBDeviceInfo:
     """USB device information"""
     vendor_id: str
@@ -162,7 +172,7 @@ class USBDeviceInfo:
     supports_interrupt_transfer: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkConnection:
     """Network connection information"""
     host: str
@@ -180,8 +190,10 @@ class NetworkConnection:
     certificate_path: Optional[str] = None
 
 
-# Protocol constants for different connection types
-SERIAL_PROTOCOLS = {
+# Protocol constants for different connection types — read-only views
+# so the write-once tables cannot be mutated by callers and lookups can
+# assume a stable key set
+SERIAL_PROTOCOLS = MappingProxyType({
     "CLEAR_SCREEN": b"\x0C",
     "CARRIAGE_RETURN": b"\r",
     "LINE_FEED": b"\n",
@@ -190,20 +202,20 @@ SERIAL_PROTOCOLS = {
     "BACKSPACE": b"\x08",
     "TAB": b"\x09",
     "ESCAPE": b"\x1B"
-}
+})
 
-USB_PROTOCOLS = {
+USB_PROTOCOLS = MappingProxyType({
     "HID_CLEAR": b"\x01\x0C",
     "HID_WRITE": b"\x02",
     "HID_CURSOR": b"\x03",
     "HID_CONFIG": b"\x04"
-}
+})
 
-NETWORK_PROTOCOLS = {
+NETWORK_PROTOCOLS = MappingProxyType({
     "JSON_COMMAND": "json",
     "BINARY_COMMAND": "binary",
     "TEXT_COMMAND": "text"
-}
+})
 
 # MostaGare specific message templates
 MOSTAGARE_TEMPLATES = {
@@ -223,4 +235,27 @@ MOSTAGARE_TEMPLATES = {
         "{quantity}x {price}{currency} + {tax}{currency}",
         "Total: {total}{currency}"
     ]
+}
+
+
+def _compile_template(template):
+    """Pre-parse a format string into a render callable"""
+    if isinstance(template, list):
+        return [_compile_template(line) for line in template]
+
+    tokens = list(string.Formatter().parse(template))
+
+    def render(fields: Dict[str, Any]) -> str:
+        return "".join(
+            literal + (format(fields[name], spec or "") if name else "")
+            for literal, name, spec, _conv in tokens
+        )
+
+    return render
+
+
+# Templates are tokenized once at import; each renderer formats from a
+# field dict without re-parsing the braces on every payment display
+MOSTAGARE_RENDERERS = {
+    key: _compile_template(value) for key, value in MOSTAGARE_TEMPLATES.items()
 }
\ No newline at end of file
@@ -5,6 +5,8 @@ Description: Configuration models for virtual displays
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional, Literal
 from datetime import datetime
 from enum import Enum
@@ -37,7 +39,7 @@ class FailureType(Enum):
     CHECKSUM_ERROR = "checksum-error"
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayMetrics:
     """Performance metrics for a virtual display"""
     # Communication metrics
@@ -75,7 +77,7 @@ class ConnectionType(Enum):
     BLUETOOTH = "bluetooth"
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualDisplayConfig:
     """Configuration for a virtual display"""
     # Basic configuration
@@ -125,7 +127,7 @@ class VirtualDisplayConfig:
     keep_alive_interval: int = 30000  # milliseconds
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualDisplay:
     """Virtual display state and configuration"""
     id: str
@@ -134,7 +136,7 @@ class VirtualDisplay:
     # Current state
     is_active: bool = False
     connection_status: ConnectionStatus = ConnectionStatus.DISCONNECTED
-    current_content: List[str] = field(default_factory=list)
+    current_content: Optional[List[str]] = None
     cursor_position: tuple[int, int] = (0, 0)  # (line, column)
     
     # Metadata
@@ -146,19 +148,23 @@ class VirtualDisplay:
     metrics: DisplayMetrics = field(default_factory=DisplayMetrics)
     
     # Internal state
-    buffer: List[str] = field(default_factory=list)
+    buffer: Optional[List[str]] = None
     command_queue: List[Dict[str, Any]] = field(default_factory=list)
     error_history: List[Dict[str, Any]] = field(default_factory=list)
-    
+
     def __post_init__(self):
         """Initialize content and buffer arrays"""
-        if not self.current_content:
-            self.current_content = [""] * self.config.display_lines
-        if not self.buffer:
-            self.buffer = [""] * self.config.display_lines
+        # None sentinel: the common "not provided" case is one identity
+        # check, and the default_factory empty-list allocation that was
+        # immediately replaced is gone
+        lines = self.config.display_lines
+        if self.current_content is None:
+            self.current_content = [""] * lines
+        if self.buffer is None:
+            self.buffer = [""] * lines
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayProfile:
     """Predefined display profiles"""
     name: str
@@ -229,9 +235,26 @@ DISPLAY_THEMES = {
     }
 }
 
+# Flat read-only (bg, text, border) tuple per theme: one lookup on the
+# render path instead of the three-level DISPLAY_THEMES walk.
+# DISPLAY_THEMES stays the source of truth for names and editor UIs.
+THEME_COLORS = MappingProxyType({
+    theme: (info["colors"]["bg"], info["colors"]["text"], info["colors"]["border"])
+    for theme, info in DISPLAY_THEMES.items()
+})
+
 # Common baud rates
 BAUD_RATES = [1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200]
 
+@lru_cache(maxsize=128)
+def _cursor_position(line: int, col: int) -> str:
+    """Build the ANSI cursor-position sequence for (line, col)"""
+    # The whole grid of a 4x20 display fits in the cache, so repeated
+    # cursor moves become a dict hit instead of a fresh f-string;
+    # strings are immutable, so sharing the cached result is safe
+    return f"\x1B[{line};{col}H"
+
+
 # Common serial commands
 COMMON_COMMANDS = {
     "CLEAR_SCREEN": "\x0C",
@@ -239,7 +262,7 @@ COMMON_COMMANDS = {
     "LINE_FEED": "\n",
     "NEW_LINE": "\r\n",
     "HOME": "\x1B[H",
-    "CURSOR_POSITION": lambda line, col: f"\x1B[{line};{col}H",
+    "CURSOR_POSITION": _cursor_position,
     "CLEAR_LINE": "\x1B[K",
     "BACKSPACE": "\x08",
     "TAB": "\x09",
@@ -19,13 +19,11 @@ class TestStatus(Enum):
     SKIPPED = "skipped"
 
 
-class ResultStatus(Enum):
-    """Result status for test execution"""
-    PENDING = "pending"
-    RUNNING = "running" 
-    PASSED = "passed"
-    FAILED = "failed"
-    SKIPPED = "skipped"
+# ResultStatus duplicated TestStatus member for member; keeping it as an
+# alias means TestStatus.PASSED and ResultStatus.PASSED are the same
+# object, so identity checks work across the two names and only one set
+# of enum members exists
+ResultStatus = TestStatus
 
 
 class ScenarioCategory(Enum):
@@ -48,7 +46,7 @@ class ValidationRuleType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationRule:
     """Validation rule for tests"""
     type: ValidationRuleType
@@ -57,7 +55,7 @@ class ValidationRule:
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation rule"""
     rule: ValidationRule
@@ -66,7 +64,7 @@ class ValidationResult:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TestStep:
     """Individual test step - simple version for scenario loading"""
     name: str
@@ -82,7 +80,7 @@ class TestStep:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of test step execution"""
     step_id: str
@@ -105,7 +103,7 @@ class StepResult:
     step_metrics: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SuccessCriteria:
     """Success criteria for tests"""
     min_success_rate: float = 95.0  # percentage
@@ -115,7 +113,7 @@ class SuccessCriteria:
     custom_validations: List[ValidationRule] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TestScenario:
     """Test scenario definition"""
     id: str
@@ -129,7 +127,7 @@ class TestScenario:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Test execution result"""
     scenario_id: str
@@ -168,7 +166,7 @@ class TestResult:
     environment: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TestReport:
     """Complete test report"""
     id: str
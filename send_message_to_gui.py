@@ -8,6 +8,7 @@ Description: Simple script to send a message that will be visible in the GUI
 import asyncio
 import time
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 # Add project root to Python path
@@ -28,24 +29,30 @@ async def send_message_to_gui():
     # Common display port names from the GUI
     test_ports = ["COM_SERIAL", "USB_DISPLAY", "USB_SERIAL"]
     
-    # Test message
-    test_message = f"Message externe {time.strftime('%H:%M:%S')}"
+    # Test message — one strftime call up front, shared by every port
+    ts = time.strftime('%H:%M:%S')
+    test_message = f"Message externe {ts}"
     
     print(f"🔍 Recherche d'afficheurs actifs...")
     print(f"📝 Message à envoyer: '{test_message}'")
     print()
     
     found_displays = False
-    
+
+    # One base config built outside the loop; each port variant is a
+    # single dataclasses.replace instead of re-running the full
+    # constructor and its list default factories per iteration
+    base_config = VirtualDisplayConfig(
+        port_name="",
+        connection_type=ConnectionType.SERIAL,
+        baud_rate=9600
+    )
+
     for port_name in test_ports:
         try:
             # Try to create the port first (in case it doesn't exist)
-            config = VirtualDisplayConfig(
-                port_name=port_name,
-                connection_type=ConnectionType.SERIAL,
-                baud_rate=9600
-            )
-            
+            config = replace(base_config, port_name=port_name)
+
             # Check if port exists in the emulator
             if port_name not in emulator.ports:
                 print(f"⚙️  Création du port {port_name}...")
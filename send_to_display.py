@@ -7,22 +7,86 @@ Description: Send messages to running VirtualDisplayPy GUI via file communicatio
 
 import sys
 import time
+import atexit
+import socket
+import struct
 import tempfile
 import os
 from datetime import datetime
 
+# Resolved once — tempfile.gettempdir() stats candidate directories on
+# every call otherwise
+_MESSAGE_FILE = os.path.join(tempfile.gettempdir(), "virtualdisplay_messages.txt")
+
+# The GUI's QLocalServer("virtualdisplay") listens on a Unix socket at
+# this path on POSIX platforms; frames are a 1-byte port-name length,
+# a 2-byte big-endian message length, then the two UTF-8 payloads
+# (matching _FRAME_HEADER in main_gui_simple.py)
+_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "virtualdisplay")
+_FRAME_HEADER = struct.Struct(">BH")
+
+_fd = None
+
+
+def _try_send_frames(pairs) -> bool:
+    """Push the batch over the GUI's local socket, if it is listening
+
+    Delivery is a direct wakeup of the GUI process — no disk write and
+    no file-watcher round trip. Returns False when the socket is
+    unavailable (GUI not running, non-POSIX platform, oversized
+    payload) so the caller can fall back to the message file.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+
+    frames = bytearray()
+    for port_name, message in pairs:
+        port_bytes = port_name.encode('utf-8')
+        msg_bytes = message.encode('utf-8')
+        if len(port_bytes) > 0xFF or len(msg_bytes) > 0xFFFF:
+            return False
+        frames += _FRAME_HEADER.pack(len(port_bytes), len(msg_bytes))
+        frames += port_bytes + msg_bytes
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(_SOCKET_PATH)
+            sock.sendall(frames)
+        return True
+    except OSError:
+        return False
+
+
+def _message_fd() -> int:
+    """Open the shared message file once in append mode"""
+    global _fd
+    if _fd is None:
+        _fd = os.open(_MESSAGE_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        atexit.register(os.close, _fd)
+    return _fd
+
+
+def send_messages_to_display(pairs):
+    """Send a batch of (port, message) pairs in one socket push or file append"""
+    pairs = list(pairs)
+
+    # Preferred path: the framed local socket, when the GUI is running.
+    # Fallback: the shared message file, format PORT|MESSAGE one per
+    # line. A single os.write on an O_APPEND descriptor is atomic for
+    # payloads up to PIPE_BUF, so concurrent senders cannot interleave
+    # partial lines — and there is no Python buffering layer between us
+    # and the kernel.
+    if not _try_send_frames(pairs):
+        lines = "".join(f"{port_name}|{message}\n" for port_name, message in pairs)
+        os.write(_message_fd(), lines.encode('utf-8'))
+
+    for port_name, message in pairs:
+        print(f"📤 Message envoyé vers {port_name}: '{message}'")
+
+
 def send_message_to_display(port_name: str, message: str):
     """Send message to specific display port"""
-    message_file = os.path.join(tempfile.gettempdir(), "virtualdisplay_messages.txt")
-    
-    # Prepare message in format: PORT|MESSAGE
-    formatted_message = f"{port_name}|{message}\n"
-    
-    # Append to message file
-    with open(message_file, 'a', encoding='utf-8') as f:
-        f.write(formatted_message)
-    
-    print(f"📤 Message envoyé vers {port_name}: '{message}'")
+    send_messages_to_display([(port_name, message)])
 
 def main():
     """Main function"""
@@ -57,8 +121,7 @@ def main():
         print(f"🎯 Ports cibles: {', '.join(ports)}")
         print()
         
-        for port in ports:
-            send_message_to_display(port, message)
+        send_messages_to_display([(port, message) for port in ports])
         
         print()
         print("🎉 Messages envoyés!")
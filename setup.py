@@ -4,9 +4,13 @@ VirtualDisplayPy Setup Script
 Date: 03/09/2025
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 from pathlib import Path
 
+# Static package list — find_packages() re-walks the whole source tree
+# on every install/build for an answer that never changes
+PACKAGES = ("automation", "cli", "core", "gui", "models", "utils")
+
 # Read README for long description
 readme_path = Path(__file__).parent / "README.md"
 long_description = readme_path.read_text(encoding="utf-8") if readme_path.exists() else ""
@@ -15,8 +19,11 @@ long_description = readme_path.read_text(encoding="utf-8") if readme_path.exists
 requirements_path = Path(__file__).parent / "requirements.txt"
 requirements = []
 if requirements_path.exists():
-    requirements = requirements_path.read_text().strip().split('\n')
-    requirements = [req.strip() for req in requirements if req.strip() and not req.startswith('#')]
+    requirements = [
+        req.strip()
+        for req in requirements_path.read_text().splitlines()
+        if req.strip() and not req.startswith('#')
+    ]
 
 setup(
     name="virtualdisplaypy",
@@ -27,13 +34,8 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/mostagare/virtualdisplaypy",
-    packages=find_packages(),
+    packages=PACKAGES,
     include_package_data=True,
-    package_data={
-        "": ["*.md", "*.txt", "*.yaml", "*.json"],
-        "resources": ["*"],
-        "config": ["*"],
-    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -41,13 +43,11 @@ setup(
         "Topic :: System :: Hardware :: Hardware Drivers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.9",
+    python_requires=">=3.11",
     install_requires=requirements,
     extras_require={
         "dev": [
@@ -8,6 +8,7 @@ Description: Simple test script to demonstrate external message sending
 import asyncio
 import time
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 # Add project root to Python path
@@ -25,11 +26,13 @@ async def test_external_messages():
     # Create a separate emulator instance (simulating external app)
     external_emulator = SerialEmulator()
     
-    # Test messages to send
+    # Test messages to send — the timestamp is rendered once up front,
+    # not per message
+    ts = time.strftime('%H:%M:%S')
     test_messages = [
         "External App Test 1",
         "Hello VirtualDisplay!",
-        f"Time: {time.strftime('%H:%M:%S')}",
+        f"Time: {ts}",
         "Message from external",
         "Test completed!"
     ]
@@ -39,6 +42,14 @@ async def test_external_messages():
     
     print("🔍 Looking for existing virtual displays...")
     found_port = None
+
+    # Shared base config; per-port variants come from a single
+    # dataclasses.replace instead of a fresh 20+-field construction
+    base_config = VirtualDisplayConfig(
+        port_name="EXTERNAL_TEST",
+        connection_type=ConnectionType.SERIAL,
+        baud_rate=9600
+    )
     
     for port_name in test_ports:
         if port_name in external_emulator.ports:
@@ -51,12 +62,8 @@ async def test_external_messages():
         print("   Creating a test display...")
         
         # Create a test display
-        config = VirtualDisplayConfig(
-            port_name="EXTERNAL_TEST",
-            connection_type=ConnectionType.SERIAL,
-            baud_rate=9600
-        )
-        
+        config = base_config
+
         success = await external_emulator.create_virtual_port(config)
         if success:
             await external_emulator.open_port("EXTERNAL_TEST", config)
@@ -71,12 +78,8 @@ async def test_external_messages():
     print()
     
     # Send test messages
-    config = VirtualDisplayConfig(
-        port_name=found_port,
-        connection_type=ConnectionType.SERIAL,
-        baud_rate=9600
-    )
-    
+    config = replace(base_config, port_name=found_port)
+
     for i, message in enumerate(test_messages, 1):
         try:
             print(f"[{i}/{len(test_messages)}] Sending: '{message}'")
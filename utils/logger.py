@@ -5,38 +5,60 @@ Date: 03/09/2025
 Description: Logging configuration and setup utilities
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+# Shared formatter — built once instead of re-parsing the format string
+# on every setup call
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
 
-def setup_logger(name: str, level: str = "INFO", 
+
+def setup_logger(name: str, level: str = "INFO",
                 log_file: Optional[Path] = None) -> logging.Logger:
     """Setup logger with consistent formatting"""
-    
+
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
-    
+
     # Avoid duplicate handlers
     if logger.handlers:
         return logger
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler if specified
+
+    # Records keep propagating to the root logger, so whatever the
+    # application configured there (console, virtualdisplay.log) still
+    # sees these modules. A console handler is only attached when the
+    # root has none — standalone entrypoints like cli/test_runner_cli.py
+    # would otherwise lose their INFO output entirely — so nothing is
+    # ever printed twice under main.py's root configuration.
+    handlers = []
+    if not logging.getLogger().handlers:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(_FORMATTER)
+        handlers.append(console_handler)
+
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    
-    return logger
\ No newline at end of file
+        file_handler.setFormatter(_FORMATTER)
+        handlers.append(file_handler)
+
+    if handlers:
+        # The caller only pays for enqueueing the record: asctime
+        # rendering and the stream/file writes run on the listener's
+        # background thread, off the emulator's per-message path
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+
+        listener = QueueListener(log_queue, *handlers,
+                                 respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+    return logger